@@ -1,2 +1,2 @@
 from .engine import generate_event
-from .state import apply_state_delta, tick_state
+from .state import apply_state_delta, apply_state_delta_and_tick, tick_state
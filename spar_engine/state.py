@@ -1,26 +1,17 @@
 from __future__ import annotations
 
-from typing import Dict, List
+from typing import Dict, List, Tuple
 
 from .models import EngineState, StateDelta
 
 
-def apply_state_delta(
+def _apply_delta_parts(
     state: EngineState,
     delta: StateDelta,
-    *,
-    recent_max_len: int = 12,
-    clock_min: int = 0,
-    clock_max: int = 12,
-) -> EngineState:
-    """Apply a StateDelta to an EngineState (pure function).
-
-    v0.1 policy:
-    - clocks: add deltas (missing clocks treated as 0) and clamp to [clock_min, clock_max]
-    - recent_event_ids: prepend new IDs, de-dupe, cap length
-    - tag_cooldowns_set: set cooldowns to max(existing, set_value)
-    - flags_set: overwrite keys provided
-    """
+    recent_max_len: int,
+    clock_min: int,
+    clock_max: int,
+) -> Tuple[Dict[str, int], List[str], Dict[str, int], Dict[str, bool]]:
     clocks: Dict[str, int] = dict(state.clocks)
     for k, v in (delta.clocks or {}).items():
         clocks[k] = int(clocks.get(k, 0) + int(v))
@@ -45,6 +36,48 @@ def apply_state_delta(
     for k, v in (delta.flags_set or {}).items():
         flags[k] = bool(v)
 
+    return clocks, recent, tag_cooldowns, flags
+
+
+def _age_parts(
+    tag_cooldowns: Dict[str, int],
+    recent: List[str],
+    t: int,
+) -> Tuple[Dict[str, int], List[str]]:
+    aged_cooldowns: Dict[str, int] = {}
+    for tag, cd in (tag_cooldowns or {}).items():
+        n = max(0, int(cd) - t)
+        if n > 0:
+            aged_cooldowns[tag] = n
+
+    recent = list(recent or [])
+    # Age recent_event_ids by dropping the oldest entries at a rate of 1 per tick
+    drop = min(t, len(recent))
+    if drop:
+        recent = recent[:-drop]
+
+    return aged_cooldowns, recent
+
+
+def apply_state_delta(
+    state: EngineState,
+    delta: StateDelta,
+    *,
+    recent_max_len: int = 12,
+    clock_min: int = 0,
+    clock_max: int = 12,
+) -> EngineState:
+    """Apply a StateDelta to an EngineState (pure function).
+
+    v0.1 policy:
+    - clocks: add deltas (missing clocks treated as 0) and clamp to [clock_min, clock_max]
+    - recent_event_ids: prepend new IDs, de-dupe, cap length
+    - tag_cooldowns_set: set cooldowns to max(existing, set_value)
+    - flags_set: overwrite keys provided
+    """
+    clocks, recent, tag_cooldowns, flags = _apply_delta_parts(
+        state, delta, recent_max_len, clock_min, clock_max
+    )
     return EngineState(
         clocks=clocks,
         recent_event_ids=recent,
@@ -66,17 +99,7 @@ def tick_state(state: EngineState, ticks: int = 1) -> EngineState:
     if t == 0:
         return state
 
-    tag_cooldowns: Dict[str, int] = {}
-    for tag, cd in (state.tag_cooldowns or {}).items():
-        n = max(0, int(cd) - t)
-        if n > 0:
-            tag_cooldowns[tag] = n
-
-    recent = list(state.recent_event_ids or [])
-    # Age recent_event_ids by dropping the oldest entries at a rate of 1 per tick
-    drop = min(t, len(recent))
-    if drop:
-        recent = recent[:-drop]
+    tag_cooldowns, recent = _age_parts(state.tag_cooldowns, state.recent_event_ids, t)
 
     return EngineState(
         clocks=dict(state.clocks),
@@ -84,3 +107,32 @@ def tick_state(state: EngineState, ticks: int = 1) -> EngineState:
         tag_cooldowns=tag_cooldowns,
         flags=dict(state.flags),
     )
+
+
+def apply_state_delta_and_tick(
+    state: EngineState,
+    delta: StateDelta,
+    ticks: int = 1,
+    *,
+    recent_max_len: int = 12,
+    clock_min: int = 0,
+    clock_max: int = 12,
+) -> EngineState:
+    """Apply a StateDelta, then advance time by `ticks` (pure function).
+
+    Equivalent to `tick_state(apply_state_delta(state, delta, ...), ticks)` but
+    builds a single EngineState, for batch loops that tick between every event.
+    """
+    clocks, recent, tag_cooldowns, flags = _apply_delta_parts(
+        state, delta, recent_max_len, clock_min, clock_max
+    )
+    t = max(0, int(ticks))
+    if t:
+        tag_cooldowns, recent = _age_parts(tag_cooldowns, recent, t)
+
+    return EngineState(
+        clocks=clocks,
+        recent_event_ids=recent,
+        tag_cooldowns=tag_cooldowns,
+        flags=flags,
+    )
@@ -7,28 +7,50 @@ _REPO_ROOT = _Path(__file__).resolve().parents[1]
 if str(_REPO_ROOT) not in sys.path:
     sys.path.insert(0, str(_REPO_ROOT))
 
-from collections import Counter
+from datetime import datetime
 import json
 from pathlib import Path
-from typing import Any, Dict, List
+import re
+from typing import Any, Dict, List, Tuple
 import random
 import time
 
+import pandas as pd
 import streamlit as st
 
+# Faster JSON for large scenario/report files, with graceful fallback
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from spar_engine.content import load_pack
 from spar_engine.engine import generate_event
-from spar_engine.models import Constraints, SceneContext, SelectionContext
+from spar_engine.models import Constraints, EngineState, SceneContext, SelectionContext
 from spar_engine.rng import TraceRNG
-from spar_engine.state import apply_state_delta, tick_state
+from spar_engine.state import apply_state_delta_and_tick, tick_state
 
+from streamlit_harness.batch_runner import event_to_dict, run_batch, run_batches, summarize_events
+from streamlit_harness.campaign_context import get_campaign_context, init_campaign_context_state
+from streamlit_harness.campaign_ui import render_campaign_ui
 from streamlit_harness.harness_state import HarnessState
+from streamlit_harness.session_packet import SessionPacket
 
 
 DEFAULT_PACK = "data/core_complications.json"
+DATA_DIR = Path("data")
 SCENARIOS_DIR = Path("scenarios")
 CONFIG_FILE = Path(".streamlit_harness_config.json")
 
+# Event history shown in the Events tab (newest-first).
+EVENT_HISTORY_LIMIT = 500
+EVENT_PAGE_SIZE = 10
+
+# Parsed content packs keyed by str(path) -> (st_mtime_ns, entries), warmed
+# once at startup and re-parsed when the file's mtime changes.
+PACK_REGISTRY: Dict[str, Tuple[int, Tuple[Any, ...]]] = {}
+
 
 def load_config() -> Dict[str, Any]:
     """Load persistent configuration from disk."""
@@ -53,12 +75,48 @@ def save_config(config: Dict[str, Any]) -> None:
         pass  # Fail silently - don't disrupt UX if config save fails
 
 
+def session_config() -> Dict[str, Any]:
+    """Config dict cached in session state, so each session reads the file once.
+
+    Read-only: write through update_config(), which merges into the file.
+    """
+    config = st.session_state.get("config_cache")
+    if config is None:
+        config = load_config()
+        st.session_state["config_cache"] = config
+    return config
+
+
+def update_config(**updates: Any) -> None:
+    """Set config keys on disk without clobbering keys other sessions saved.
+
+    Re-reads the file right before writing, so only the given keys change,
+    then refreshes this session's cached copy.
+    """
+    config = load_config()
+    config.update(updates)
+    save_config(config)
+    st.session_state["config_cache"] = config
+
+
 def split_csv(v: str) -> List[str]:
     if not v:
         return []
     return [x.strip() for x in v.split(",") if x.strip()]
 
 
+@st.cache_data
+def _split_csv_cached(v: str) -> Tuple[str, ...]:
+    """Cached split_csv for tag fields that are re-parsed on every rerun."""
+    return tuple(split_csv(v))
+
+
+@st.cache_data
+def _merged_include_tags(default: str, ctx_include: str) -> str:
+    """Merge default and campaign-context include tags into a sorted, deduped CSV."""
+    return ",".join(sorted(set(_split_csv_cached(default)) | set(_split_csv_cached(ctx_include))))
+
+
 def scene_preset_values(preset: str) -> Dict[str, Any]:
     preset = (preset or "").strip().lower()
     if preset == "dungeon":
@@ -82,7 +140,7 @@ def get_hs() -> HarnessState:
 def init_persistent_paths() -> None:
     """Initialize persistent path state from config file."""
     if "paths_initialized" not in st.session_state:
-        config = load_config()
+        config = session_config()
         # Sanitize all paths when loading from config to ensure no directory separators
         scenario_path = config.get("scenario_output_path", "scenarios/results/scenario_output.json")
         template_path = config.get("template_save_path", "scenarios/my_scenario.json")
@@ -107,18 +165,54 @@ def update_persistent_path(key: str, value: str, manual_edit: bool = False) -> N
         manual_edit: If True, also sets the manual edit flag
     """
     st.session_state[key] = value
-    config = load_config()
-    config[key] = value
+    updates = {key: value}
     if manual_edit:
-        config["output_path_manually_edited"] = True
+        updates["output_path_manually_edited"] = True
         st.session_state.output_path_manually_edited = True
-    save_config(config)
+    update_config(**updates)
+
+
+def persist_path_input(key: str, widget_key: str, manual_edit: bool = False) -> None:
+    """on_change callback for path text inputs: persist only when the user commits an edit."""
+    value = st.session_state.get(widget_key)
+    if value and value != st.session_state.get(key):
+        update_persistent_path(key, value, manual_edit=manual_edit)
+
+
+def set_path_default(state_key: str, widget_key: str, path: str) -> None:
+    """Replace a save path's default, including the keyed input already showing it.
+
+    A keyed text_input ignores later value= changes, so the widget's own
+    state is overwritten too. Call before the input renders in this run.
+    """
+    st.session_state[state_key] = path
+    st.session_state[widget_key] = path
+
+
+def persistent_path_input(
+    label: str,
+    state_key: str,
+    widget_key: str,
+    help_text: str,
+    manual_edit: bool = False,
+) -> str:
+    """Save-path text_input backed by session state; persisted to config when edited."""
+    # Seed the widget through its key rather than value=, so code that
+    # replaces the default by setting widget_key doesn't conflict with it
+    if widget_key not in st.session_state:
+        st.session_state[widget_key] = st.session_state[state_key]
+    return st.text_input(
+        label,
+        help=help_text,
+        key=widget_key,
+        on_change=persist_path_input,
+        args=(state_key, widget_key, manual_edit),
+    )
 
 
 def sanitize_basename(basename: str) -> str:
     """Sanitize basename to remove path separators and other problematic characters."""
     # Replace all potentially problematic characters
-    import re
     # Remove or replace: spaces, slashes, backslashes, parentheses, commas, periods, etc.
     sanitized = basename.lower()
     # Replace spaces and path separators with underscores
@@ -135,13 +229,16 @@ def sanitize_basename(basename: str) -> str:
     return sanitized
 
 
+def suite_basename(suite_name: str) -> str:
+    """Filename stem for a suite name (e.g. 'Presets × Engage' -> 'presets_x_engage')."""
+    return suite_name.lower().replace(' ', '_').replace('×', 'x').replace('(', '').replace(')', '')
+
+
 def sanitize_path(path: str) -> str:
     """Sanitize a full file path to ensure no unintended directory separators in basename.
     
     Extracts directory and filename, sanitizes the basename, and reconstructs the path.
     """
-    from pathlib import Path
-    
     # Split into directory and filename
     path_obj = Path(path)
     directory = path_obj.parent
@@ -196,70 +293,70 @@ def resolve_seed_value(seed_input: Any) -> int:
         return generate_random_seed()
 
 
+@st.cache_resource
+def _all_packs() -> Dict[str, Tuple[int, Tuple[Any, ...]]]:
+    """Parse every content pack under data/ once per server process."""
+    packs: Dict[str, Tuple[int, Tuple[Any, ...]]] = {}
+    for p in sorted(DATA_DIR.glob("*.json")):
+        try:
+            packs[str(p)] = (p.stat().st_mtime_ns, tuple(load_pack(p)))
+        except Exception:
+            continue  # Skip JSON files that aren't content packs
+    return packs
+
+
+def warm_pack_registry() -> None:
+    """Populate PACK_REGISTRY from the cached startup scan of data/."""
+    if not PACK_REGISTRY:
+        PACK_REGISTRY.update(_all_packs())
+
+
 def load_entries(pack_path: str):
     p = Path(pack_path)
-    if not p.exists():
-        raise FileNotFoundError(f"Pack not found: {pack_path}")
-    return load_pack(p)
+    try:
+        mtime_ns = p.stat().st_mtime_ns
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Pack not found: {pack_path}") from None
+    cached = PACK_REGISTRY.get(str(p))
+    if cached is None:
+        return load_pack(p)
+    if cached[0] != mtime_ns:
+        # Registered pack edited on disk since it was parsed
+        cached = (mtime_ns, tuple(load_pack(p)))
+        PACK_REGISTRY[str(p)] = cached
+    return cached[1]
+
+
+@st.cache_data
+def _cached_load_entries(pack_path: str, mtime_ns: int):
+    """load_entries() memoized per pack file version (mtime_ns is the cache key)."""
+    return load_entries(pack_path)
+
+
+def load_entries_cached(pack_path: str):
+    """Load a pack, re-parsing only when the file on disk has changed.
+
+    Every path, including the data/ packs in PACK_REGISTRY, is keyed on
+    its current mtime, so an edited pack is never served stale.
+    """
+    p = Path(pack_path)
+    try:
+        mtime_ns = p.stat().st_mtime_ns
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Pack not found: {pack_path}") from None
+    return _cached_load_entries(str(p), mtime_ns)
 
 
 def derive_tag_vocab(entries) -> List[str]:
-    s = set()
-    for e in entries:
-        for t in e.tags:
-            s.add(t)
-    return sorted(s)
-
-
-def event_to_dict(ev) -> Dict[str, Any]:
-    d = ev.__dict__.copy()
-    d["effect_vector"] = ev.effect_vector.__dict__
-    d["fiction"] = ev.fiction.__dict__
-    d["state_delta"] = ev.state_delta.__dict__
-    return d
-
-
-def summarize_events(events: List[Dict[str, Any]]) -> Dict[str, Any]:
-    severities = [int(e.get("severity", 0)) for e in events]
-    cutoff_count = sum(1 for e in events if e.get("cutoff_applied"))
-
-    buckets = {"1-3": 0, "4-6": 0, "7-10": 0}
-    for s in severities:
-        if s <= 3:
-            buckets["1-3"] += 1
-        elif s <= 6:
-            buckets["4-6"] += 1
-        else:
-            buckets["7-10"] += 1
-
-    tag_counts = Counter()
-    id_counts = Counter()
-    resolution_counts = Counter()
-    for e in events:
-        id_counts[e.get("event_id")] += 1
-        resolution_counts[str(e.get("cutoff_resolution", "none"))] += 1
-        for t in e.get("tags", []) or []:
-            tag_counts[t] += 1
-
-    return {
-        "n": len(events),
-        "cutoff_rate": (cutoff_count / max(1, len(events))),
-        "severity_buckets": buckets,
-        "severity_min": min(severities) if severities else None,
-        "severity_max": max(severities) if severities else None,
-        "severity_avg": (sum(severities) / len(severities)) if severities else None,
-        "top_tags": tag_counts.most_common(15),
-        "top_event_ids": id_counts.most_common(15),
-        "cutoff_resolutions": dict(resolution_counts),
-    }
+    return sorted({t for e in entries for t in (e.tags or ())})
 
 
-def diagnostics(events: List[Dict[str, Any]]) -> None:
+def diagnostics(events: List[Dict[str, Any]], summary: Dict[str, Any] | None = None) -> None:
     if not events:
         st.info("No batch to analyze yet.")
         return
 
-    s = summarize_events(events)
+    s = summary if summary is not None else summarize_events(events)
     st.write("**Cutoff rate:**", f"{s['cutoff_rate']*100:.1f}%")
     st.write("**Severity buckets:**")
     st.bar_chart(s["severity_buckets"])
@@ -296,45 +393,6 @@ def event_card(e: Dict[str, Any]) -> None:
         st.code(json.dumps(e, indent=2), language="json")
 
 
-def run_batch(
-    *,
-    scene: SceneContext,
-    selection: SelectionContext,
-    entries,
-    seed: int,
-    n: int,
-    starting_engine_state,
-    tick_between: bool,
-    ticks_between: int,
-    verbose: bool,
-) -> Dict[str, Any]:
-    state = starting_engine_state
-    rng = TraceRNG(seed=int(seed))
-    events: List[Dict[str, Any]] = []
-
-    for idx in range(int(n)):
-        if idx > 0:
-            # Always tick at least 1 to prevent cooldown accumulation
-            # Without ticking, tag cooldowns never expire and content exhausts quickly
-            tick_amount = max(1, int(ticks_between) if tick_between else 1)
-            state = tick_state(state, ticks=tick_amount)
-
-        rng.trace.clear()
-        ev = generate_event(scene, state, selection, entries, rng)
-        state = apply_state_delta(state, ev.state_delta)
-        events.append(event_to_dict(ev))
-
-    summary = summarize_events(events)
-    return {
-        "seed": int(seed),
-        "n": int(n),
-        "final_state": state.__dict__,
-        "summary": summary,
-        "events": events if verbose else None,
-        "events_sample": None if verbose else events[:10],
-    }
-
-
 def report_to_markdown(report: Dict[str, Any]) -> str:
     lines: List[str] = []
     lines.append(f"# Scenario Suite Report: {report.get('suite')}")
@@ -372,10 +430,10 @@ def report_to_markdown(report: Dict[str, Any]) -> str:
     return "\n".join(lines)
 
 
-def load_scenario_json(file_content: str) -> Dict[str, Any]:
-    """Load and validate a scenario JSON."""
+def load_scenario_json(file_content: str | bytes) -> Dict[str, Any]:
+    """Load and validate a scenario JSON (str, or raw bytes from an upload)."""
     try:
-        scenario = json.loads(file_content)
+        scenario = orjson.loads(file_content) if ORJSON_AVAILABLE else json.loads(file_content)
     except json.JSONDecodeError as e:
         raise ValueError(f"Invalid JSON: {e}")
     
@@ -428,17 +486,66 @@ def get_builtin_scenarios() -> List[Dict[str, Any]]:
     return sorted(scenarios, key=lambda s: s.get("name", ""))
 
 
+@st.cache_data(show_spinner=False)
+def _cached_scenario_library(
+    fingerprint: Tuple[Tuple[str, float], ...],
+) -> Tuple[List[str], Dict[str, Dict[str, Any]]]:
+    """Dropdown labels and name -> scenario lookup, per directory fingerprint."""
+    by_name: Dict[str, Dict[str, Any]] = {}
+    for s in get_builtin_scenarios():
+        if "name" in s:
+            by_name.setdefault(s["name"], s)  # first file wins on duplicate names
+    return list(by_name), by_name
+
+
+def builtin_scenario_library() -> Tuple[List[str], Dict[str, Dict[str, Any]]]:
+    """Return (names, scenarios_by_name), re-parsing only when scenarios/*.json change."""
+    fingerprint: Tuple[Tuple[str, float], ...] = ()
+    if SCENARIOS_DIR.exists():
+        fingerprint = tuple(sorted((str(p), p.stat().st_mtime) for p in SCENARIOS_DIR.glob("*.json")))
+    return _cached_scenario_library(fingerprint)
+
+
+def suite_summary_frame(report: Dict[str, Any]) -> pd.DataFrame:
+    """Per-run summary table for a suite report, built column-wise."""
+    runs = report.get("runs", [])
+    summaries = [run["result"]["summary"] for run in runs]
+    buckets = [s["severity_buckets"] for s in summaries]
+    return pd.DataFrame({
+        "preset": [run["preset"] for run in runs],
+        "phase": [run["phase"] for run in runs],
+        "rarity_mode": [run["rarity_mode"] for run in runs],
+        "cutoff_rate_pct": (pd.Series([s["cutoff_rate"] for s in summaries], dtype=float) * 100.0).round(2),
+        "cutoff_resolutions": [s.get("cutoff_resolutions", {}) for s in summaries],
+        "bucket_1_3": [b["1-3"] for b in buckets],
+        "bucket_4_6": [b["4-6"] for b in buckets],
+        "bucket_7_10": [b["7-10"] for b in buckets],
+        "severity_avg": pd.Series([s["severity_avg"] for s in summaries], dtype=float).round(2),
+        "severity_min": [s["severity_min"] for s in summaries],
+        "severity_max": [s["severity_max"] for s in summaries],
+    })
+
+
 def save_report_to_path(report: Dict[str, Any], path: str) -> tuple[bool, str]:
     """Save report JSON to specified file path.
     
     Returns: (success: bool, message: str)
     """
+    p = Path(path)
+    tmp = p.with_name(p.name + ".tmp")
     try:
-        p = Path(path)
         p.parent.mkdir(parents=True, exist_ok=True)
-        p.write_text(json.dumps(report, indent=2))
+        if ORJSON_AVAILABLE:
+            tmp.write_bytes(orjson.dumps(report, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        else:
+            # Stream to disk rather than building the whole JSON string in memory
+            with tmp.open("w", encoding="utf-8", buffering=1 << 20) as fh:
+                json.dump(report, fh, indent=2)
+        # Replace only after a complete write so a failed save never truncates the old file
+        tmp.replace(p)
         return True, f"Report saved to {path}"
     except Exception as e:
+        tmp.unlink(missing_ok=True)
         return False, f"Failed to save: {str(e)}"
 
 
@@ -486,29 +593,39 @@ def run_matrix_scenario(
         "runs": [],
     }
     
+    # Loop-invariant settings, resolved once
+    include_tags = split_csv(scenario.get("include_tags", ""))
+    exclude_tags = split_csv(scenario.get("exclude_tags", ""))
+    batch_size = int(scenario["batch_size"])
+    tick_between = bool(scenario.get("tick_between", True))
+    ticks_between = int(scenario.get("ticks_between", 1))
+    verbose = bool(scenario.get("verbose", False))
+    
     run_idx = 0
     for preset_name in scenario["presets"]:
         pv = scene_preset_values(preset_name)
+        env = list(pv["env"])
+        constraints = Constraints(
+            confinement=float(pv["confinement"]),
+            connectivity=float(pv["connectivity"]),
+            visibility=float(pv["visibility"]),
+        )
         for phase in scenario["phases"]:
             for rarity_mode in scenario["rarity_modes"]:
                 run_idx += 1
                 scene = SceneContext(
                     scene_id=f"scenario:{scenario['name']}:{preset_name}:{phase}:{rarity_mode}",
                     scene_phase=phase,  # type: ignore
-                    environment=list(pv["env"]),
+                    environment=env,
                     tone=["debug"],
-                    constraints=Constraints(
-                        confinement=float(pv["confinement"]),
-                        connectivity=float(pv["connectivity"]),
-                        visibility=float(pv["visibility"]),
-                    ),
+                    constraints=constraints,
                     party_band="unknown",
                     spotlight=["debug"],
                 )
                 selection = SelectionContext(
                     enabled_packs=["core_complications"],
-                    include_tags=split_csv(scenario.get("include_tags", "")),
-                    exclude_tags=split_csv(scenario.get("exclude_tags", "")),
+                    include_tags=include_tags,
+                    exclude_tags=exclude_tags,
                     factions_present=[],
                     rarity_mode=rarity_mode,  # type: ignore
                 )
@@ -518,11 +635,11 @@ def run_matrix_scenario(
                     selection=selection,
                     entries=entries,
                     seed=seed,
-                    n=int(scenario["batch_size"]),
+                    n=batch_size,
                     starting_engine_state=engine_state_class.default(),
-                    tick_between=bool(scenario.get("tick_between", True)),
-                    ticks_between=int(scenario.get("ticks_between", 1)),
-                    verbose=bool(scenario.get("verbose", False)),
+                    tick_between=tick_between,
+                    ticks_between=ticks_between,
+                    verbose=verbose,
                 )
                 report["runs"].append({
                     "preset": preset_name,
@@ -622,7 +739,6 @@ def run_campaign_scenario(
         # Update shared state from result's final state
         shared_state = result["final_state"]
         # Convert dict back to EngineState object for next iteration
-        from spar_engine.state import EngineState
         if isinstance(shared_state, dict):
             shared_state = EngineState(**shared_state)
         
@@ -650,13 +766,192 @@ def run_campaign_scenario(
     return report
 
 
+@st.fragment
+def render_sidebar(hs: HarnessState, context) -> None:
+    """Event Generator sidebar inputs.
+
+    Runs as a fragment: widget changes rerun only the sidebar and store their
+    values on `hs.inputs`; the main body picks them up on its next full rerun.
+    """
+    inp = hs.inputs
+    st.header("Inputs")
+
+    inp.preset = st.selectbox("Scene preset", ["dungeon", "city", "wilderness", "ruins"], index=0)
+    pv = scene_preset_values(inp.preset)
+
+    inp.scene_id = st.text_input("Scene ID", value="harness")
+    inp.scene_phase = st.selectbox("Scene phase", ["approach", "engage", "aftermath"], index=1)
+    inp.party_band = st.selectbox("Party band", ["low", "mid", "high", "unknown"], index=3)
+    inp.rarity_mode = st.selectbox("Rarity mode", ["calm", "normal", "spiky"], index=1)
+
+    inp.confinement = st.slider("Confinement", 0.0, 1.0, float(pv["confinement"]), 0.05)
+    inp.connectivity = st.slider("Connectivity", 0.0, 1.0, float(pv["connectivity"]), 0.05)
+    inp.visibility = st.slider("Visibility", 0.0, 1.0, float(pv["visibility"]), 0.05)
+
+    inp.pack_path = st.text_input("Content pack path", value=DEFAULT_PACK)
+    inp.seed = st.number_input("Seed", min_value=0, max_value=10**9, value=42, step=1)
+
+    # Canonical batch size lives on HarnessState (never a local variable)
+    batch_n = st.selectbox(
+        "Batch count",
+        [10, 50, 200],
+        index=[10, 50, 200].index(hs.batch_n) if hs.batch_n in [10, 50, 200] else 1,
+    )
+    if batch_n != hs.batch_n:
+        hs.batch_n = batch_n
+        st.rerun()  # Generate button label lives in the main body
+
+    inp.tick_mode = st.selectbox("Tick mode", ["none", "turn", "scene"], index=0)
+    inp.ticks = st.number_input("Ticks", min_value=0, max_value=100, value=0, step=1)
+
+    st.caption("Batch runs are sequential by default (treat each generated event as a 'turn').")
+    inp.tick_between = st.checkbox("Tick between events in batch", value=True)
+    inp.ticks_between_events = st.number_input("Ticks between events", min_value=0, max_value=10, value=1, step=1)
+
+    # Pre-fill tags from campaign context if available
+    default_include_tags = "hazard,reinforcements,time_pressure,social_friction,visibility,mystic,attrition,terrain,positioning,opportunity,information"
+    default_exclude_tags = ""
+    
+    if context and st.session_state.get("context_enabled", True):
+        # Merge context tags with defaults
+        context_include, context_exclude = context.to_tag_csv()
+        if context_include:
+            # Add context tags to defaults (dedupe)
+            default_include_tags = _merged_include_tags(default_include_tags, context_include)
+        if context_exclude:
+            default_exclude_tags = context_exclude
+    
+    inp.include_tags_text = st.text_input(
+        "Include tags (CSV)",
+        value=default_include_tags,
+    )
+    inp.exclude_tags_text = st.text_input("Exclude tags (CSV)", value=default_exclude_tags)
+
+    st.divider()
+    st.subheader("State")
+
+    if st.button("Reset session state"):
+        hs.reset()
+        st.toast("Session reset.", icon="✅")
+        st.rerun()  # Full rerun so the Events/Diagnostics tabs clear too
+
+    # Only serialize the engine state when the debug view is open
+    if st.checkbox("Show current state", value=False):
+        st.text_area(
+            "Current state (read-only)",
+            value=json.dumps(hs.engine_state.__dict__, indent=2),
+            height=180,
+        )
+
+    st.divider()
+    st.subheader("Pack")
+
+    load_clicked = st.button("Load pack")
+    # Auto-load only once per session; after a failure, wait for an explicit click
+    if load_clicked or (not hs.pack_entries and not hs.pack_load_attempted):
+        hs.pack_load_attempted = True
+        try:
+            entries = load_entries_cached(inp.pack_path)
+            hs.pack_entries = entries
+            hs.tag_vocab = derive_tag_vocab(entries)
+            hs.pack_load_error = None
+            st.toast(f"Loaded {len(entries)} entries", icon="✅")
+            if load_clicked:
+                st.rerun()  # Full rerun so the main body uses the new pack
+        except Exception as ex:
+            hs.pack_load_error = str(ex)
+
+    if hs.pack_load_error:
+        st.error(hs.pack_load_error)
+
+    if hs.tag_vocab:
+        st.caption("Pack tags:")
+        st.write(hs.tag_vocab)
+
+
+@st.cache_resource(max_entries=32)
+def build_scene_context(
+    scene_id: str,
+    scene_phase: str,
+    environment: Tuple[str, ...],
+    confinement: float,
+    connectivity: float,
+    visibility: float,
+    party_band: str,
+) -> SceneContext:
+    """Build the generator's SceneContext, reusing the instance while inputs are unchanged."""
+    return SceneContext(
+        scene_id=scene_id,
+        scene_phase=scene_phase,  # type: ignore
+        environment=list(environment),
+        tone=["debug"],
+        constraints=Constraints(confinement=confinement, connectivity=connectivity, visibility=visibility),
+        party_band=party_band,  # type: ignore
+        spotlight=["debug"],
+    )
+
+
+@st.cache_resource(max_entries=32)
+def build_selection_context(
+    include_tags: Tuple[str, ...],
+    exclude_tags: Tuple[str, ...],
+    rarity_mode: str,
+) -> SelectionContext:
+    """Build the generator's SelectionContext, reusing the instance while inputs are unchanged."""
+    return SelectionContext(
+        enabled_packs=["core_complications_v0_1"],
+        include_tags=list(include_tags),
+        exclude_tags=list(exclude_tags),
+        factions_present=[],
+        rarity_mode=rarity_mode,  # type: ignore
+    )
+
+
+@st.fragment
+def render_event_list(hs: HarnessState) -> None:
+    """Render one page of the event history.
+
+    Runs as a fragment so paging only reruns the list, not the sidebar or diagnostics.
+    """
+    if not hs.events:
+        st.info("No events generated yet.")
+        return
+
+    n_pages = (len(hs.events) + EVENT_PAGE_SIZE - 1) // EVENT_PAGE_SIZE
+    hs.events_page = min(hs.events_page, n_pages - 1)
+
+    def _turn_page(step: int) -> None:
+        hs.events_page += step
+
+    prev_col, label_col, next_col = st.columns([1, 2, 1])
+    prev_col.button(
+        "◀ Newer", disabled=hs.events_page == 0, use_container_width=True,
+        on_click=_turn_page, args=(-1,),
+    )
+    next_col.button(
+        "Older ▶", disabled=hs.events_page >= n_pages - 1, use_container_width=True,
+        on_click=_turn_page, args=(1,),
+    )
+    label_col.caption(f"Page {hs.events_page + 1} of {n_pages} ({len(hs.events)} events)")
+
+    start = hs.events_page * EVENT_PAGE_SIZE
+    for e in hs.events[start:start + EVENT_PAGE_SIZE]:
+        with st.container(border=True):
+            event_card(e)
+
+
+def _disable_context() -> None:
+    """on_click callback: turn off campaign context before the next run renders."""
+    st.session_state.context_enabled = False
+
+
 def main() -> None:
     st.set_page_config(page_title="SPAR Engine Harness v0.1", layout="wide")
     init_persistent_paths()
+    warm_pack_registry()
     hs = get_hs()
     
     # Initialize campaign context
-    from streamlit_harness.campaign_context import init_campaign_context_state, get_campaign_context
     init_campaign_context_state()
     
     # Mode selector at top
@@ -670,7 +965,6 @@ def main() -> None:
     
     # Render campaign UI if in campaign mode
     if mode == "🎲 Campaign Manager":
-        from streamlit_harness.campaign_ui import render_campaign_ui
         render_campaign_ui()
         return
     
@@ -691,9 +985,7 @@ def main() -> None:
             with col2:
                 if st.button("View", key="view_context"):
                     st.session_state.show_context_details = not st.session_state.get("show_context_details", False)
-                if st.button("Disable", key="disable_context"):
-                    st.session_state.context_enabled = False
-                    st.rerun()
+                st.button("Disable", key="disable_context", on_click=_disable_context)
             
             if st.session_state.get("show_context_details", False):
                 st.markdown("**Why this context?**")
@@ -702,106 +994,36 @@ def main() -> None:
 
     # ---------------- Sidebar ----------------
     with st.sidebar:
-        st.header("Inputs")
-
-        preset = st.selectbox("Scene preset", ["dungeon", "city", "wilderness", "ruins"], index=0)
-        pv = scene_preset_values(preset)
-
-        scene_id = st.text_input("Scene ID", value="harness")
-        scene_phase = st.selectbox("Scene phase", ["approach", "engage", "aftermath"], index=1)
-        party_band = st.selectbox("Party band", ["low", "mid", "high", "unknown"], index=3)
-        rarity_mode = st.selectbox("Rarity mode", ["calm", "normal", "spiky"], index=1)
-
-        confinement = st.slider("Confinement", 0.0, 1.0, float(pv["confinement"]), 0.05)
-        connectivity = st.slider("Connectivity", 0.0, 1.0, float(pv["connectivity"]), 0.05)
-        visibility = st.slider("Visibility", 0.0, 1.0, float(pv["visibility"]), 0.05)
-
-        pack_path = st.text_input("Content pack path", value=DEFAULT_PACK)
-        seed = st.number_input("Seed", min_value=0, max_value=10**9, value=42, step=1)
-
-        # Canonical batch size lives on HarnessState (never a local variable)
-        hs.batch_n = st.selectbox(
-            "Batch count",
-            [10, 50, 200],
-            index=[10, 50, 200].index(hs.batch_n) if hs.batch_n in [10, 50, 200] else 1,
-        )
-
-        tick_mode = st.selectbox("Tick mode", ["none", "turn", "scene"], index=0)
-        ticks = st.number_input("Ticks", min_value=0, max_value=100, value=0, step=1)
-
-        st.caption("Batch runs are sequential by default (treat each generated event as a 'turn').")
-        tick_between = st.checkbox("Tick between events in batch", value=True)
-        ticks_between_events = st.number_input("Ticks between events", min_value=0, max_value=10, value=1, step=1)
-
-        # Pre-fill tags from campaign context if available
-        default_include_tags = "hazard,reinforcements,time_pressure,social_friction,visibility,mystic,attrition,terrain,positioning,opportunity,information"
-        default_exclude_tags = ""
-        
-        if context and st.session_state.get("context_enabled", True):
-            # Merge context tags with defaults
-            context_include, context_exclude = context.to_tag_csv()
-            if context_include:
-                # Add context tags to defaults (dedupe)
-                all_include = set(split_csv(default_include_tags) + split_csv(context_include))
-                default_include_tags = ",".join(sorted(all_include))
-            if context_exclude:
-                default_exclude_tags = context_exclude
-        
-        include_tags_text = st.text_input(
-            "Include tags (CSV)",
-            value=default_include_tags,
-        )
-        exclude_tags_text = st.text_input("Exclude tags (CSV)", value=default_exclude_tags)
-
-        st.divider()
-        st.subheader("State")
-
-        if st.button("Reset session state"):
-            hs.reset()
-            st.toast("Session reset.", icon="✅")
-
-        st.text_area(
-            "Current state (read-only)",
-            value=json.dumps(hs.engine_state.__dict__, indent=2),
-            height=180,
-        )
-
-        st.divider()
-        st.subheader("Pack")
-
-        if st.button("Load pack") or not hs.pack_entries:
-            try:
-                entries = load_entries(pack_path)
-                hs.pack_entries = entries
-                hs.tag_vocab = derive_tag_vocab(entries)
-                st.toast(f"Loaded {len(entries)} entries", icon="✅")
-            except Exception as ex:
-                st.error(str(ex))
-
-        if hs.tag_vocab:
-            st.caption("Pack tags:")
-            st.write(hs.tag_vocab)
+        render_sidebar(hs, context)
+
+    inp = hs.inputs
+    preset = inp.preset
+    pv = scene_preset_values(preset)
+    scene_id = inp.scene_id
+    scene_phase = inp.scene_phase
+    party_band = inp.party_band
+    rarity_mode = inp.rarity_mode
+    confinement = inp.confinement
+    connectivity = inp.connectivity
+    visibility = inp.visibility
+    seed = inp.seed
+    tick_mode = inp.tick_mode
+    ticks = inp.ticks
+    tick_between = inp.tick_between
+    ticks_between_events = inp.ticks_between_events
+    include_tags_text = inp.include_tags_text
+    exclude_tags_text = inp.exclude_tags_text
 
     entries = hs.pack_entries
     if not entries:
         st.info("Load a content pack from the sidebar to begin.")
         return
 
-    scene = SceneContext(
-        scene_id=scene_id,
-        scene_phase=scene_phase,  # type: ignore
-        environment=list(pv["env"]),
-        tone=["debug"],
-        constraints=Constraints(confinement=confinement, connectivity=connectivity, visibility=visibility),
-        party_band=party_band,  # type: ignore
-        spotlight=["debug"],
+    scene = build_scene_context(
+        scene_id, scene_phase, tuple(pv["env"]), confinement, connectivity, visibility, party_band
     )
-    selection = SelectionContext(
-        enabled_packs=["core_complications_v0_1"],
-        include_tags=split_csv(include_tags_text),
-        exclude_tags=split_csv(exclude_tags_text),
-        factions_present=[],
-        rarity_mode=rarity_mode,  # type: ignore
+    selection = build_selection_context(
+        _split_csv_cached(include_tags_text), _split_csv_cached(exclude_tags_text), rarity_mode
     )
 
     tabs = st.tabs(["Events", "Scenarios"])
@@ -822,28 +1044,28 @@ def main() -> None:
                     hs.engine_state = tick_state(hs.engine_state, ticks=int(ticks))
 
                 rng = TraceRNG(seed=int(seed))
+                between = int(ticks_between_events) if tick_between else 0
 
                 batch_events: List[Dict[str, Any]] = []
                 for idx in range(n):
-                    if idx > 0 and tick_between and int(ticks_between_events) > 0:
-                        hs.engine_state = tick_state(hs.engine_state, ticks=int(ticks_between_events))
-
                     rng.trace.clear()
                     ev = generate_event(scene, hs.engine_state, selection, entries, rng)
-                    hs.engine_state = apply_state_delta(hs.engine_state, ev.state_delta)
+                    # Fold the between-events tick into the delta application (one state copy)
+                    ticks_after = between if idx < n - 1 else 0
+                    hs.engine_state = apply_state_delta_and_tick(hs.engine_state, ev.state_delta, ticks=ticks_after)
 
-                    d = event_to_dict(ev)
-                    batch_events.append(d)
-                    hs.events.insert(0, d)
+                    batch_events.append(event_to_dict(ev))
 
+                hs.events = (batch_events[::-1] + hs.events)[:EVENT_HISTORY_LIMIT]
+                hs.events_page = 0
                 hs.last_batch = batch_events
+                hs.last_batch_summary = summarize_events(batch_events)
 
             # Finalize Session button (Flow B: Generator → Campaign)
             if hs.events and st.session_state.get("active_campaign_context"):
                 if st.button("✅ Finalize Session", type="primary", use_container_width=True):
                     # Create session packet from last batch
                     if hs.last_batch:
-                        from streamlit_harness.session_packet import SessionPacket
                         packet = SessionPacket.from_run_result(
                             scenario_name=f"{preset} / {scene_phase} / {rarity_mode}",
                             preset=preset,
@@ -852,7 +1074,7 @@ def main() -> None:
                             seed=seed,
                             batch_size=hs.batch_n,
                             events=hs.last_batch,
-                            summary=summarize_events(hs.last_batch),
+                            summary=hs.last_batch_summary or summarize_events(hs.last_batch),
                         )
                         st.session_state.pending_session_packet = packet
                         
@@ -862,20 +1084,16 @@ def main() -> None:
                         st.rerun()
                 st.divider()
             
-            if hs.events:
-                for e in hs.events[:25]:
-                    with st.container(border=True):
-                        event_card(e)
-            else:
-                st.info("No events generated yet.")
+            render_event_list(hs)
 
         with colB:
             st.header("Diagnostics")
-            diagnostics(hs.last_batch)
+            diagnostics(hs.last_batch, hs.last_batch_summary)
 
     with tabs[1]:
         st.header("Scenario Runner (Multi-run)")
         st.caption("Run predefined multi-run suites and download a debug report for tuning.")
+        st.caption(f"📁 Working directory: {Path.cwd()} (relative save paths below resolve from here)")
         
         # JSON Scenario Import/Export Section
         st.subheader("JSON Scenario Import/Export")
@@ -889,25 +1107,21 @@ def main() -> None:
             uploaded_file = st.file_uploader("Upload scenario JSON", type=['json'])
             
             # Library dropdown
-            builtin_scenarios = get_builtin_scenarios()
-            # Filter out scenarios without names and create dropdown list
-            valid_scenarios = [s for s in builtin_scenarios if "name" in s]
-            scenario_names = ["-- Select from library --"] + [s["name"] for s in valid_scenarios]
+            library_names, scenarios_by_name = builtin_scenario_library()
+            scenario_names = ["-- Select from library --"] + library_names
             selected_scenario_name = st.selectbox("Or select from library", scenario_names)
             
             # Load scenario
             loaded_scenario = None
             if uploaded_file is not None:
                 try:
-                    content = uploaded_file.read().decode('utf-8')
-                    loaded_scenario = load_scenario_json(content)
+                    loaded_scenario = load_scenario_json(uploaded_file.getvalue())
                     st.success(f"Loaded: {loaded_scenario['name']}")
                 except Exception as e:
                     st.error(f"Failed to load scenario: {e}")
             elif selected_scenario_name != "-- Select from library --":
-                matching = [s for s in valid_scenarios if s["name"] == selected_scenario_name]
-                if matching:
-                    loaded_scenario = matching[0]
+                loaded_scenario = scenarios_by_name.get(selected_scenario_name)
+                if loaded_scenario:
                     st.success(f"Loaded: {loaded_scenario['name']}")
             
             # Display loaded scenario details
@@ -965,7 +1179,6 @@ def main() -> None:
                     st.session_state.last_loaded_scenario = scenario_name
                     
                     # New scenario selected - generate fresh filename with timestamp
-                    from datetime import datetime
                     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
                     
                     # Use output_basename if provided, otherwise sanitize scenario name
@@ -992,27 +1205,17 @@ def main() -> None:
                     st.session_state.scenario_output_path = new_path
                     
                     # Persist to config file
-                    config = load_config()
-                    config["scenario_output_path"] = new_path
-                    save_config(config)
-            
-            st.caption(f"📁 Working directory: {Path.cwd()}")
-            
-            # Store current value before widget to detect changes
-            previous_path = st.session_state.get("scenario_output_path", "results/scenario_output.json")
+                    update_config(scenario_output_path=new_path)
             
-            output_path = st.text_input(
+            # User edits persist (with the manual edit flag) via on_change, not on every rerun
+            output_path = persistent_path_input(
                 "Save results to path",
-                value=st.session_state.scenario_output_path,
-                help="Full file path where results JSON will be saved (persisted between sessions). Relative paths are from working directory shown above.",
-                key="output_path_input"
+                "scenario_output_path",
+                "output_path_input",
+                "Full file path where results JSON will be saved (persisted between sessions). Relative paths are from working directory shown above.",
+                manual_edit=True,
             )
             
-            # Detect if user manually changed the path
-            if output_path != previous_path:
-                # Update path and set manual edit flag (persisted to config)
-                update_persistent_path("scenario_output_path", output_path, manual_edit=True)
-            
             run_and_save = st.button(
                 "Run and Save Scenario",
                 type="primary",
@@ -1029,6 +1232,7 @@ def main() -> None:
                             hs.engine_state.__class__
                         )
                         hs.last_suite_report = report
+                        hs.last_suite_summary = None
                     
                     # Save to specified path
                     if output_path:
@@ -1048,45 +1252,29 @@ def main() -> None:
         # Existing hardcoded suite section
         st.subheader("Hardcoded Suites (Legacy)")
         
-        suite = st.selectbox(
-            "Suite",
-            [
-                "Presets × Engage × Normal (quick)",
-                "Presets × (Approach/Engage/Aftermath) × Normal",
-                "Presets × Engage × (Calm/Normal/Spiky)",
-            ],
-            index=0,
-        )
-
-        presets = ["dungeon", "city", "wilderness", "ruins"]
-
-        if suite == "Presets × Engage × Normal (quick)":
-            phases = ["engage"]
-            rarity_modes = ["normal"]
-        elif suite == "Presets × (Approach/Engage/Aftermath) × Normal":
-            phases = ["approach", "engage", "aftermath"]
-            rarity_modes = ["normal"]
-        else:
-            phases = ["engage"]
-            rarity_modes = ["calm", "normal", "spiky"]
-
-        batchN = st.number_input("Batch size per run", min_value=10, max_value=500, value=int(hs.batch_n), step=10)
-        
         # Initialize base_seed_value in session state if not present
         if "base_seed_value" not in st.session_state:
             st.session_state.base_seed_value = 1000
         
-        # Base seed with random option
-        col_seed1, col_seed2 = st.columns([3, 1])
-        
-        # Check if dice button was clicked
-        with col_seed2:
-            if st.button("🎲", help="Generate random seed"):
-                # Generate and store the actual random integer
-                st.session_state.base_seed_value = generate_random_seed()
-                st.rerun()
+        # Dice stays outside the form so it updates the seed immediately
+        if st.button("🎲 Random base seed", help="Generate random seed"):
+            # Generate and store the actual random integer
+            st.session_state.base_seed_value = generate_random_seed()
         
-        with col_seed1:
+        # Suite settings only apply on submit, so editing them doesn't rerun the whole tab
+        with st.form("suite_config", clear_on_submit=False, border=False):
+            suite = st.selectbox(
+                "Suite",
+                [
+                    "Presets × Engage × Normal (quick)",
+                    "Presets × (Approach/Engage/Aftermath) × Normal",
+                    "Presets × Engage × (Calm/Normal/Spiky)",
+                ],
+                index=0,
+            )
+
+            batchN = st.number_input("Batch size per run", min_value=10, max_value=500, value=int(hs.batch_n), step=10)
+            
             # Use number_input to show the current seed value
             base_seed = st.number_input(
                 "Base seed",
@@ -1096,47 +1284,52 @@ def main() -> None:
                 step=1,
                 help="Click dice button for random seed, or enter a number (0-999999999)"
             )
-            # Update session state when user changes value
-            if base_seed != st.session_state.base_seed_value:
-                st.session_state.base_seed_value = base_seed
 
-        include_tags_suite = st.text_input("Include tags (CSV)", value=include_tags_text)
-        exclude_tags_suite = st.text_input("Exclude tags (CSV)", value=exclude_tags_text)
+            include_tags_suite = st.text_input("Include tags (CSV)", value=include_tags_text)
+            exclude_tags_suite = st.text_input("Exclude tags (CSV)", value=exclude_tags_text)
 
-        tick_between_suite = st.checkbox("Tick between events in each batch", value=True)
-        ticks_between_suite = st.number_input("Ticks between events", min_value=0, max_value=10, value=1, step=1)
+            tick_between_suite = st.checkbox("Tick between events in each batch", value=True)
+            ticks_between_suite = st.number_input("Ticks between events", min_value=0, max_value=10, value=1, step=1)
 
-        verbose_report = st.checkbox("Include full event lists in report", value=False)
+            verbose_report = st.checkbox("Include full event lists in report", value=False)
+            
+            col_run, col_save = st.columns(2)
+            run_suite = col_run.form_submit_button("Run suite", type="primary", use_container_width=True)
+            save_template = col_save.form_submit_button("Save as Template", use_container_width=True)
         
-        run_suite = st.button("Run suite", type="primary")
+        # Update session state when user changes value
+        if base_seed != st.session_state.base_seed_value:
+            st.session_state.base_seed_value = base_seed
+
+        presets = ["dungeon", "city", "wilderness", "ruins"]
+
+        if suite == "Presets × Engage × Normal (quick)":
+            phases = ["engage"]
+            rarity_modes = ["normal"]
+        elif suite == "Presets × (Approach/Engage/Aftermath) × Normal":
+            phases = ["approach", "engage", "aftermath"]
+            rarity_modes = ["normal"]
+        else:
+            phases = ["engage"]
+            rarity_modes = ["calm", "normal", "spiky"]
         
         # Save current settings as template
         st.subheader("Save Current Settings as Template")
         
-        # Generate default path with timestamp for current suite
-        from datetime import datetime
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        default_basename = suite.lower().replace(' ', '_').replace('×', 'x').replace('(', '').replace(')', '')
-        default_template_path = f"scenarios/{default_basename}_{timestamp}.json"
+        # Generate a timestamped default path once per suite selection (stable across reruns)
+        default_basename = suite_basename(suite)
+        if st.session_state.get("template_default_suite") != suite:
+            st.session_state.template_default_suite = suite
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            set_path_default("template_save_path", "template_path_input", f"scenarios/{default_basename}_{timestamp}.json")
         
-        # Update persistent config with new default
-        if st.session_state.template_save_path != default_template_path:
-            update_persistent_path("template_save_path", default_template_path)
-        
-        st.caption(f"📁 Working directory: {Path.cwd()}")
-        template_path = st.text_input(
+        template_path = persistent_path_input(
             "Save template to path",
-            value=st.session_state.template_save_path,
-            help="Full file path where scenario JSON will be saved. Relative paths are from working directory shown above.",
-            key="template_path_input"
+            "template_save_path",
+            "template_path_input",
+            "Full file path where scenario JSON will be saved. Relative paths are from working directory shown above.",
         )
         
-        # Update persistent config
-        if template_path and template_path != st.session_state.template_save_path:
-            update_persistent_path("template_save_path", template_path)
-        
-        save_template = st.button("Save as Template", use_container_width=True)
-        
         if save_template:
             # Export current settings as scenario JSON
             current_scenario = {
@@ -1182,55 +1375,66 @@ def main() -> None:
                     "runs": [],
                 }
 
+                # Build every run up front; runs are independent so they can execute in parallel
+                run_keys: List[Dict[str, Any]] = []
+                tasks: List[Dict[str, Any]] = []
+                suite_include = split_csv(include_tags_suite)
+                suite_exclude = split_csv(exclude_tags_suite)
                 run_idx = 0
                 for preset_name in presets:
                     pv2 = scene_preset_values(preset_name)
+                    env2 = list(pv2["env"])
+                    constraints2 = Constraints(
+                        confinement=float(pv2["confinement"]),
+                        connectivity=float(pv2["connectivity"]),
+                        visibility=float(pv2["visibility"]),
+                    )
                     for ph in phases:
                         for rm in rarity_modes:
                             run_idx += 1
                             scene2 = SceneContext(
                                 scene_id=f"suite:{suite}:{preset_name}:{ph}:{rm}",
                                 scene_phase=ph,  # type: ignore
-                                environment=list(pv2["env"]),
+                                environment=env2,
                                 tone=["debug"],
-                                constraints=Constraints(
-                                    confinement=float(pv2["confinement"]),
-                                    connectivity=float(pv2["connectivity"]),
-                                    visibility=float(pv2["visibility"]),
-                                ),
+                                constraints=constraints2,
                                 party_band="unknown",
                                 spotlight=["debug"],
                             )
                             selection2 = SelectionContext(
                                 enabled_packs=["core_complications_v0_1"],
-                                include_tags=split_csv(include_tags_suite),
-                                exclude_tags=split_csv(exclude_tags_suite),
+                                include_tags=suite_include,
+                                exclude_tags=suite_exclude,
                                 factions_present=[],
                                 rarity_mode=rm,  # type: ignore
                             )
                             seed2 = int(base_seed) + run_idx
-                            result = run_batch(
-                                scene=scene2,
-                                selection=selection2,
-                                entries=entries,
-                                seed=seed2,
-                                n=int(batchN),
-                                starting_engine_state=hs.engine_state.__class__.default(),
-                                tick_between=bool(tick_between_suite),
-                                ticks_between=int(ticks_between_suite),
-                                verbose=bool(verbose_report),
-                            )
-                            suite_report["runs"].append(
-                                {
-                                    "preset": preset_name,
-                                    "phase": ph,
-                                    "rarity_mode": rm,
-                                    "seed": seed2,
-                                    "result": result,
-                                }
-                            )
-
+                            run_keys.append({"preset": preset_name, "phase": ph, "rarity_mode": rm, "seed": seed2})
+                            tasks.append({
+                                "scene": scene2,
+                                "selection": selection2,
+                                "seed": seed2,
+                                "n": int(batchN),
+                                "tick_between": bool(tick_between_suite),
+                                "ticks_between": int(ticks_between_suite),
+                                "verbose": bool(verbose_report),
+                            })
+
+                with st.status(f"Running suite ({len(tasks)} runs)...") as status:
+                    progress = st.progress(0.0)
+                    results = run_batches(
+                        tasks,
+                        entries,
+                        on_progress=lambda done, total: progress.progress(done / total, text=f"{done}/{total} runs"),
+                    )
+                    status.update(label=f"Ran {len(tasks)} runs.", state="complete")
+
+                suite_report["runs"] = [{**key, "result": result} for key, result in zip(run_keys, results)]
                 hs.last_suite_report = suite_report
+                hs.last_suite_summary = None
+                # Fresh timestamped default report path for each completed run
+                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                set_path_default("report_save_path", "report_path_input", f"results/{suite_basename(suite)}_{timestamp}.json")
                 st.success("Suite completed.")
             except Exception as ex:
                 st.error(str(ex))
@@ -1239,51 +1443,20 @@ def main() -> None:
         if report:
             st.subheader("Suite Summary")
 
-            rows = []
-            for run in report.get("runs", []):
-                s = run["result"]["summary"]
-                rows.append(
-                    {
-                        "preset": run["preset"],
-                        "phase": run["phase"],
-                        "rarity_mode": run["rarity_mode"],
-                        "cutoff_rate_pct": round(s["cutoff_rate"] * 100.0, 2),
-                        "cutoff_resolutions": s.get("cutoff_resolutions", {}),
-                        "bucket_1_3": s["severity_buckets"]["1-3"],
-                        "bucket_4_6": s["severity_buckets"]["4-6"],
-                        "bucket_7_10": s["severity_buckets"]["7-10"],
-                        "severity_avg": round(s["severity_avg"], 2) if s["severity_avg"] is not None else None,
-                        "severity_min": s["severity_min"],
-                        "severity_max": s["severity_max"],
-                    }
-                )
-            st.dataframe(rows, use_container_width=True, hide_index=True)
+            # Built once per report rather than on every rerun
+            if hs.last_suite_summary is None:
+                hs.last_suite_summary = suite_summary_frame(report)
+            st.dataframe(hs.last_suite_summary, use_container_width=True, hide_index=True)
             
             st.subheader("Save Report")
             
-            # Generate default path with timestamp from suite name
-            if report:
-                from datetime import datetime
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                suite_basename = report.get("suite", "suite_report").lower().replace(' ', '_').replace('×', 'x').replace('(', '').replace(')', '')
-                default_report_path = f"results/{suite_basename}_{timestamp}.json"
-                
-                # Update persistent config with new default
-                if st.session_state.report_save_path != default_report_path:
-                    update_persistent_path("report_save_path", default_report_path)
-            
-            st.caption(f"📁 Working directory: {Path.cwd()}")
-            report_path = st.text_input(
+            report_path = persistent_path_input(
                 "Save report to path",
-                value=st.session_state.report_save_path,
-                help="Full file path where report JSON will be saved. Relative paths are from working directory shown above.",
-                key="report_path_input"
+                "report_save_path",
+                "report_path_input",
+                "Full file path where report JSON will be saved. Relative paths are from working directory shown above.",
             )
             
-            # Update persistent config
-            if report_path and report_path != st.session_state.report_save_path:
-                update_persistent_path("report_save_path", report_path)
-            
             save_report = st.button("Save Report", use_container_width=True)
             
             if save_report:
@@ -0,0 +1,165 @@
+"""
+Batch execution for the Streamlit harness.
+
+Kept free of Streamlit imports so independent suite runs can be fanned out
+to worker processes without each worker importing the UI module.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from spar_engine.engine import generate_event
+from spar_engine.models import EngineState, SceneContext, SelectionContext
+from spar_engine.rng import TraceRNG
+from spar_engine.state import apply_state_delta, apply_state_delta_and_tick
+
+
+def event_to_dict(ev) -> Dict[str, Any]:
+    d = ev.__dict__.copy()
+    d["effect_vector"] = ev.effect_vector.__dict__
+    d["fiction"] = ev.fiction.__dict__
+    d["state_delta"] = ev.state_delta.__dict__
+    return d
+
+
+def summarize_events(events: List[Dict[str, Any]]) -> Dict[str, Any]:
+    severities = [int(e.get("severity", 0)) for e in events]
+    cutoff_count = sum(1 for e in events if e.get("cutoff_applied"))
+
+    buckets = {"1-3": 0, "4-6": 0, "7-10": 0}
+    for s in severities:
+        if s <= 3:
+            buckets["1-3"] += 1
+        elif s <= 6:
+            buckets["4-6"] += 1
+        else:
+            buckets["7-10"] += 1
+
+    tag_counts = Counter()
+    id_counts = Counter()
+    resolution_counts = Counter()
+    for e in events:
+        id_counts[e.get("event_id")] += 1
+        resolution_counts[str(e.get("cutoff_resolution", "none"))] += 1
+        for t in e.get("tags", []) or []:
+            tag_counts[t] += 1
+
+    return {
+        "n": len(events),
+        "cutoff_rate": (cutoff_count / max(1, len(events))),
+        "severity_buckets": buckets,
+        "severity_min": min(severities) if severities else None,
+        "severity_max": max(severities) if severities else None,
+        "severity_avg": (sum(severities) / len(severities)) if severities else None,
+        "top_tags": tag_counts.most_common(15),
+        "top_event_ids": id_counts.most_common(15),
+        "cutoff_resolutions": dict(resolution_counts),
+    }
+
+
+def run_batch(
+    *,
+    scene: SceneContext,
+    selection: SelectionContext,
+    entries,
+    seed: int,
+    n: int,
+    starting_engine_state,
+    tick_between: bool,
+    ticks_between: int,
+    verbose: bool,
+) -> Dict[str, Any]:
+    state = starting_engine_state
+    rng = TraceRNG(seed=int(seed))
+    events: List[Dict[str, Any]] = []
+
+    # Always tick at least 1 between events to prevent cooldown accumulation
+    # Without ticking, tag cooldowns never expire and content exhausts quickly
+    tick_amount = max(1, int(ticks_between) if tick_between else 1)
+    last_idx = int(n) - 1
+
+    for idx in range(int(n)):
+        rng.trace.clear()
+        ev = generate_event(scene, state, selection, entries, rng)
+        if idx < last_idx:
+            # Apply this event and tick toward the next one in a single state copy
+            state = apply_state_delta_and_tick(state, ev.state_delta, ticks=tick_amount)
+        else:
+            state = apply_state_delta(state, ev.state_delta)
+        events.append(event_to_dict(ev))
+
+    summary = summarize_events(events)
+    return {
+        "seed": int(seed),
+        "n": int(n),
+        "final_state": state.__dict__,
+        "summary": summary,
+        "events": events if verbose else None,
+        "events_sample": None if verbose else events[:10],
+    }
+
+
+# Content pack for pool workers, set once per process by _init_worker.
+_WORKER_ENTRIES: Any = None
+
+# Below this many tasks, spawning workers (~1s) costs more than it saves, so
+# they run serially. The built-in suites (at most 12 runs) stay in-process.
+PARALLEL_MIN_TASKS = 16
+
+
+def _init_worker(entries) -> None:
+    global _WORKER_ENTRIES
+    _WORKER_ENTRIES = entries
+
+
+def _run_task(task: Dict[str, Any]) -> Dict[str, Any]:
+    return run_batch(entries=_WORKER_ENTRIES, starting_engine_state=EngineState.default(), **task)
+
+
+def run_batches(
+    tasks: Sequence[Dict[str, Any]],
+    entries,
+    *,
+    max_workers: Optional[int] = None,
+    min_parallel_tasks: int = PARALLEL_MIN_TASKS,
+    on_progress: Optional[Callable[[int, int], None]] = None,
+) -> List[Dict[str, Any]]:
+    """Run independent batches, in parallel across processes when CPUs allow.
+
+    Each task holds run_batch keyword arguments other than `entries` and
+    `starting_engine_state`; every run starts from EngineState.default().
+    Fewer than `min_parallel_tasks` tasks run serially in this process.
+    Workers are spawned rather than forked: the caller is Streamlit's
+    multithreaded server, and a forked child can inherit a lock held by
+    another thread. The pack is shipped to each worker once (pool
+    initializer), not per task. Results are returned in task order;
+    `on_progress(done, total)` is called as runs finish.
+    """
+    total = len(tasks)
+    workers = min(max_workers or os.cpu_count() or 1, total)
+    results: List[Dict[str, Any]] = [{}] * total
+
+    if workers <= 1 or total < min_parallel_tasks:
+        for idx, task in enumerate(tasks):
+            results[idx] = run_batch(entries=entries, starting_engine_state=EngineState.default(), **task)
+            if on_progress:
+                on_progress(idx + 1, total)
+        return results
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(entries,),
+    ) as ex:
+        futures = {ex.submit(_run_task, task): idx for idx, task in enumerate(tasks)}
+        for done, fut in enumerate(as_completed(futures), start=1):
+            results[futures[fut]] = fut.result()
+            if on_progress:
+                on_progress(done, total)
+    return results
@@ -10,14 +10,28 @@ This module provides a multi-campaign management interface with:
 - Campaign ledger (history tracking)
 """
 
+import bisect
+import hashlib
+import heapq
 import json
-from dataclasses import dataclass, field
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
 from datetime import datetime
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import streamlit as st
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from spar_campaign import CampaignState, Scar, FactionState
 from streamlit_harness.import_overrides import ImportOverrides
 
@@ -25,20 +39,136 @@ from streamlit_harness.import_overrides import ImportOverrides
 CAMPAIGNS_DIR = Path("campaigns")
 CAMPAIGNS_DIR.mkdir(exist_ok=True)
 
+# Most recently played campaigns shown on the selector page
+SELECTOR_CAMPAIGN_LIMIT = 50
+
+# Display lookups for campaign bands and faction disposition
+# band -> (badge emoji, display title)
+PRESSURE_BAND_LABELS = {
+    "stable": ("🟢", "Stable"),
+    "strained": ("🟡", "Strained"),
+    "volatile": ("🟠", "Volatile"),
+    "critical": ("🔴", "Critical"),
+}
+HEAT_BAND_LABELS = {
+    "quiet": ("🔵", "Quiet"),
+    "noticed": ("🟡", "Noticed"),
+    "hunted": ("🟠", "Hunted"),
+    "exposed": ("🔴", "Exposed"),
+}
+DISPOSITION_LABELS = {
+    -2: "😡 Hostile",
+    -1: "😠 Unfriendly",
+    0: "😐 Neutral",
+    1: "🙂 Friendly",
+    2: "😊 Allied",
+}
+
+
+def _read_bytes_or_none(path: str) -> Optional[bytes]:
+    """Read a file for the list_all prefetch pool; unreadable files give None."""
+    try:
+        with open(path, "rb") as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def _dump_json(data: Any) -> bytes:
+    """Encode indented JSON, using orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode("utf-8")
+
+
+def _write_bytes_atomic(path: Path, payload: bytes) -> None:
+    """Write via a temp file and rename, so a crash never leaves a partial file."""
+    tmp = path.with_name(path.name + ".tmp")
+    try:
+        tmp.write_bytes(payload)
+        tmp.replace(path)
+    except Exception:
+        tmp.unlink(missing_ok=True)
+        raise
 
+
+def _disk_version(path: Path, payload: bytes) -> Tuple[bytes, int]:
+    """(content digest, mtime_ns) identifying what a campaign file holds."""
+    return hashlib.blake2b(payload, digest_size=16).digest(), path.stat().st_mtime_ns
+
+
+def _read_jsonl(path: Path) -> List[Any]:
+    """Parse a JSON Lines file (one value per non-blank line)."""
+    loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+    with path.open("rb") as f:
+        return [loads(line) for line in f if line.strip()]
+
+
+def _append_jsonl(path: Path, items: List[Any]) -> None:
+    """Append values to a JSON Lines file, one compact line each.
+
+    The lines go out through an O_APPEND descriptor, normally in a single
+    write(), so concurrent sessions appending to the same ledger don't
+    interleave. A short write is continued until every byte is written,
+    so a ledger line is never left truncated.
+    """
+    if ORJSON_AVAILABLE:
+        payload = b"".join(orjson.dumps(item, option=orjson.OPT_APPEND_NEWLINE) for item in items)
+    else:
+        payload = "".join(json.dumps(item) + "\n" for item in items).encode("utf-8")
+    view = memoryview(payload)
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+    try:
+        while view:
+            written = os.write(fd, view)
+            if written == 0:
+                raise OSError(f"write to {path} made no progress")
+            view = view[written:]
+    finally:
+        os.close(fd)
+
+
+@lru_cache(maxsize=64)
+def _pressure_band(pressure: int) -> str:
+    """Band name for a campaign pressure value (CampaignState thresholds, memoized)."""
+    return CampaignState(campaign_pressure=pressure).get_pressure_band()
+
+
+@lru_cache(maxsize=64)
+def _heat_band(heat: int) -> str:
+    """Band name for a heat value (CampaignState thresholds, memoized)."""
+    return CampaignState(heat=heat).get_heat_band()
+
+
+_SPECIAL_CHARS_RE = re.compile(r'[^\w\s-]')
+_SEPARATORS_RE = re.compile(r'[-\s]+')
+
+
+@lru_cache(maxsize=128)
 def normalize_campaign_name_to_dir(name: str) -> str:
     """Normalize campaign name to valid directory name.
     
     Removes special characters, replaces spaces/hyphens with underscores.
     Used for creating campaign subdirectories.
     """
-    import re
-    dir_name = re.sub(r'[^\w\s-]', '', name)  # Remove special chars
-    dir_name = re.sub(r'[-\s]+', '_', dir_name)  # Replace spaces/hyphens
+    dir_name = _SPECIAL_CHARS_RE.sub('', name)  # Remove special chars
+    dir_name = _SEPARATORS_RE.sub('_', dir_name)  # Replace spaces/hyphens
     dir_name = dir_name.strip('_')  # Remove leading/trailing underscores
     return dir_name
 
 
+_FACTION_ID_TABLE = str.maketrans({" ": "_"})
+
+
+def _faction_id(name: str) -> str:
+    """Faction ID for a display name: lowercased, spaces to underscores.
+
+    Imports match parsed names against existing faction IDs, so the mapping
+    must stay stable for campaigns already on disk.
+    """
+    return name.lower().translate(_FACTION_ID_TABLE)
+
+
 @dataclass
 class Source:
     """Content source reference (built-in or external)."""
@@ -86,6 +216,10 @@ class Campaign:
     campaign_state: Optional[CampaignState] = None
     ledger: List[Dict[str, Any]] = field(default_factory=list)
     sources: List[Source] = field(default_factory=list)
+    # Number of ledger entries already in the sidecar file (set on load/save)
+    _ledger_persisted: int = field(default=0, repr=False, compare=False)
+    # Digest and mtime of the JSON file as last loaded/saved, to skip no-op saves
+    _disk_version: Optional[Tuple[bytes, int]] = field(default=None, repr=False, compare=False)
     
     def to_dict(self) -> Dict[str, Any]:
         """Serialize to dictionary."""
@@ -121,49 +255,233 @@ class Campaign:
             sources=sources,
         )
     
+    def active_sources(self) -> List[Source]:
+        """Sources currently enabled for this campaign."""
+        return [s for s in self.sources if s.enabled]
+
     def get_path(self) -> Path:
         """Get filesystem path for this campaign in subdirectory."""
         campaign_dir = CAMPAIGNS_DIR / normalize_campaign_name_to_dir(self.name)
         return campaign_dir / f"{self.campaign_id}.json"
 
+    def get_ledger_path(self) -> Path:
+        """Get path of the append-only ledger sidecar (one session per line)."""
+        return self.get_path().with_name(f"{self.campaign_id}.ledger.jsonl")
+
+    @staticmethod
+    def from_file(path: Path) -> "Campaign":
+        """Load a campaign JSON file and its ledger sidecar, if present.
+
+        Campaigns saved before the sidecar existed keep their ledger inline;
+        it moves to the sidecar on the next save.
+        """
+        raw = path.read_bytes()
+        data = orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+        ledger_path = path.with_name(f"{path.stem}.ledger.jsonl")
+        has_sidecar = ledger_path.exists()
+        if has_sidecar:
+            data["ledger"] = _read_jsonl(ledger_path)
+        campaign = Campaign.from_dict(data)
+        if has_sidecar:
+            campaign._ledger_persisted = len(campaign.ledger)
+        campaign._disk_version = _disk_version(path, raw)
+        return campaign
+
     def save(self) -> None:
-        """Save campaign to disk in subdirectory."""
+        """Save campaign to disk in subdirectory.
+
+        Ledger entries added since the last load/save are appended to the
+        sidecar; the main JSON file holds everything else and is replaced
+        atomically, or left alone if its content would not change.
+        """
         path = self.get_path()
         path.parent.mkdir(parents=True, exist_ok=True)  # Ensure subdirectory exists
-        path.write_text(json.dumps(self.to_dict(), indent=2))
+        new_entries = self.ledger[self._ledger_persisted:]
+        if new_entries:
+            _append_jsonl(self.get_ledger_path(), new_entries)
+        self._ledger_persisted = len(self.ledger)
+        data = self.to_dict()
+        del data["ledger"]
+        payload = _dump_json(data)
+        try:
+            unchanged = self._disk_version == _disk_version(path, payload)
+        except FileNotFoundError:
+            unchanged = False
+        if unchanged and not new_entries:
+            return
+        if not unchanged:
+            _write_bytes_atomic(path, payload)
+            self._disk_version = _disk_version(path, payload)
+        _CAMPAIGN_PATHS[self.campaign_id] = path
+        # Drop cached reads so the next rerun sees this write
+        _cached_load.clear()
+        _cached_list_all.clear()
     
     @staticmethod
     def load(campaign_id: str) -> Optional["Campaign"]:
-        """Load campaign from disk (searches subdirectories)."""
-        # Search all subdirectories for the campaign file
-        for subdir in CAMPAIGNS_DIR.iterdir():
-            if subdir.is_dir():
-                path = subdir / f"{campaign_id}.json"
-                if path.exists():
-                    try:
-                        data = json.loads(path.read_text())
-                        return Campaign.from_dict(data)
-                    except Exception:
-                        continue
-        return None
+        """Load campaign from disk (located via the campaign path index)."""
+        path = _find_campaign_path(campaign_id)
+        if path is None:
+            return None
+        try:
+            return Campaign.from_file(path)
+        except Exception:
+            return None
 
     @staticmethod
-    def list_all() -> List["Campaign"]:
-        """List all campaigns from subdirectories."""
+    def list_all(limit: Optional[int] = None) -> List["CampaignSummary"]:
+        """List campaign summaries from subdirectories, most recently played first.
+
+        With a limit, only the `limit` most recent are returned.
+        """
+        paths = [entry.path for entry in _scan_campaign_files()]
+        if not paths:
+            return []
+        
+        # Read files on a small thread pool so I/O overlaps with parsing
+        loads = orjson.loads if ORJSON_AVAILABLE else json.loads
         campaigns = []
-        # Scan all subdirectories for campaign JSON files
-        for subdir in CAMPAIGNS_DIR.iterdir():
-            if subdir.is_dir():
-                for json_file in subdir.glob("campaign_*.json"):
-                    # Skip import_overrides files
-                    if "_import_overrides" in json_file.name:
+        with ThreadPoolExecutor(max_workers=min(4, len(paths))) as pool:
+            for raw in pool.map(_read_bytes_or_none, paths):
+                if raw is None:
+                    continue
+                try:
+                    campaigns.append(CampaignSummary.from_dict(loads(raw)))
+                except Exception:
+                    continue
+        if limit is not None:
+            return heapq.nlargest(limit, campaigns, key=attrgetter("last_played"))
+        return sorted(campaigns, key=attrgetter("last_played"), reverse=True)
+
+
+@dataclass(frozen=True)
+class CampaignSummary:
+    """Selector-card view of a campaign, read straight from its JSON dict.
+
+    Skips building Scar/FactionState objects and reading the ledger
+    sidecar, which the selector never shows.
+    """
+
+    campaign_id: str
+    name: str
+    last_played: str
+    has_state: bool = False
+    pressure_band: str = ""
+    heat_band: str = ""
+    total_scenes_run: int = 0
+    scars_count: int = 0
+    active_factions: int = 0
+    total_factions: int = 0
+
+    @staticmethod
+    def from_dict(data: Dict[str, Any]) -> "CampaignSummary":
+        """Summarize a campaign dictionary as written by Campaign.save()."""
+        cs = data.get("campaign_state")
+        if not cs:
+            return CampaignSummary(data["campaign_id"], data["name"], data["last_played"])
+
+        scars = cs.get("scars", [])
+        # v0.1 string scars load as legacy scars and are not listed
+        legacy_scars = cs.get("version", "0.1") == "0.1" or (scars and isinstance(scars[0], str))
+        factions = cs.get("factions", {})
+        return CampaignSummary(
+            campaign_id=data["campaign_id"],
+            name=data["name"],
+            last_played=data["last_played"],
+            has_state=True,
+            pressure_band=_pressure_band(cs.get("campaign_pressure", 0)),
+            heat_band=_heat_band(cs.get("heat", 0)),
+            total_scenes_run=cs.get("total_scenes_run", 0),
+            scars_count=0 if legacy_scars else len(scars),
+            active_factions=sum(1 for f in factions.values() if f.get("attention", 0) > 0),
+            total_factions=len(factions),
+        )
+
+
+def _scan_campaign_files() -> List[os.DirEntry]:
+    """Campaign JSON files in every campaign subdirectory (os.scandir, no Path per entry)."""
+    found = []
+    with os.scandir(CAMPAIGNS_DIR) as subdirs:
+        for subdir in subdirs:
+            if not subdir.is_dir():
+                continue
+            with os.scandir(subdir.path) as files:
+                for entry in files:
+                    name = entry.name
+                    if not (name.startswith("campaign_") and name.endswith(".json")):
                         continue
-                    try:
-                        data = json.loads(json_file.read_text())
-                        campaigns.append(Campaign.from_dict(data))
-                    except Exception:
+                    # Skip import_overrides files
+                    if "_import_overrides" in name:
                         continue
-        return sorted(campaigns, key=lambda c: c.last_played, reverse=True)
+                    found.append(entry)
+    return found
+
+
+# campaign_id -> JSON path; filled by one directory scan, refreshed on a miss.
+# Shared by all session threads, so a rescan builds a new dict and swaps it in
+# with one assignment instead of clearing and refilling this one in place.
+_CAMPAIGN_PATHS: Dict[str, Path] = {}
+
+
+def _find_campaign_path(campaign_id: str) -> Optional[Path]:
+    """Locate a campaign's JSON file without parsing it."""
+    global _CAMPAIGN_PATHS
+    path = _CAMPAIGN_PATHS.get(campaign_id)
+    if path is not None and path.exists():
+        return path
+    paths: Dict[str, Path] = {}
+    for entry in _scan_campaign_files():
+        paths.setdefault(entry.name[:-len(".json")], Path(entry.path))
+    _CAMPAIGN_PATHS = paths
+    return paths.get(campaign_id)
+
+
+def _campaigns_fingerprint() -> tuple:
+    """Cheap (path, mtime_ns) snapshot of every campaign file, for cache keys."""
+    entries = []
+    with os.scandir(CAMPAIGNS_DIR) as subdirs:
+        for subdir in subdirs:
+            if not subdir.is_dir():
+                continue
+            with os.scandir(subdir.path) as files:
+                for f in files:
+                    if f.name.endswith(".json"):
+                        entries.append((f.path, f.stat().st_mtime_ns))
+    return tuple(sorted(entries))
+
+
+@st.cache_data(max_entries=8)
+def _cached_list_all(fingerprint: tuple, limit: Optional[int] = None) -> List[CampaignSummary]:
+    """Campaign.list_all() memoized per directory fingerprint."""
+    return Campaign.list_all(limit)
+
+
+def list_campaigns(limit: Optional[int] = None) -> List[CampaignSummary]:
+    """List campaigns, re-reading files only when one was added, removed or changed."""
+    return _cached_list_all(_campaigns_fingerprint(), limit)
+
+
+@st.cache_data(max_entries=32)
+def _cached_load(path: str, mtime_ns: int) -> Optional[Campaign]:
+    """Parse a campaign file, memoized per file version (mtime_ns is the cache key)."""
+    try:
+        return Campaign.from_file(Path(path))
+    except Exception:
+        return None
+
+
+def load_campaign(campaign_id: str) -> Optional[Campaign]:
+    """Load a campaign, re-parsing JSON only when the file has changed."""
+    path = _find_campaign_path(campaign_id)
+    if path is None:
+        return None
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except OSError:
+        # Deleted or renamed since it was indexed; the next lookup rescans
+        _CAMPAIGN_PATHS.pop(campaign_id, None)
+        return None
+    return _cached_load(str(path), mtime_ns)
 
 
 def init_campaign_session() -> None:
@@ -174,6 +492,72 @@ def init_campaign_session() -> None:
         st.session_state.campaign_page = "selector"  # selector, dashboard, session, finalize
 
 
+def _go_to_page(page: str, **session_updates: Any) -> None:
+    """Button on_click callback: switch campaign page before the next run starts.
+
+    Running as a callback means the rerun Streamlit already does for the click
+    renders the new page directly, instead of finishing the old page and then
+    paying for a second full run via st.rerun().
+    """
+    st.session_state.campaign_page = page
+    for key, value in session_updates.items():
+        st.session_state[key] = value
+
+
+def _toggle_flag(key: str) -> None:
+    """Button on_click callback: flip a boolean session_state flag."""
+    st.session_state[key] = not st.session_state.get(key, False)
+
+
+def _lazy_section(label: str, key: str) -> bool:
+    """Collapsible section header; returns whether its body should be built.
+
+    st.expander builds its body on every run even while collapsed, so
+    sections that grow with the campaign (ledger, scars) use this instead
+    and skip the body entirely until opened.
+    """
+    is_open = st.session_state.get(key, False)
+    st.button(f"{'▾' if is_open else '▸'} {label}", key=f"{key}_toggle", on_click=_toggle_flag, args=(key,))
+    return is_open
+
+
+def _canon_editor_key(bullets: List[str]) -> str:
+    """Widget key for the canon editor, tied to the saved bullets.
+
+    A new key after each save resets st.data_editor's pending row edits,
+    which would otherwise be re-applied on top of the updated list.
+    """
+    digest = hashlib.blake2b("\x1f".join(bullets).encode("utf-8"), digest_size=8).hexdigest()
+    return f"canon_editor_{digest}"
+
+
+def _sort_parsed_entities(parsed: Dict[str, Any]) -> Dict[str, Any]:
+    """Sort parsed-history faction and entity lists in place; returns parsed.
+
+    The parser returns names in document order, so the review lists are
+    sorted once here, when a parse result is first stored in session state.
+    """
+    parsed["factions"].sort()
+    for names in parsed["entities"].values():
+        names.sort()
+    return parsed
+
+
+def _reclassify_entity(parsed: Dict[str, Any], name: str, src: str, dst: Optional[str] = None) -> None:
+    """Move a name between parsed-history categories in place; dst=None removes it.
+
+    Categories are "factions" or a key of parsed["entities"]. The lists are
+    sorted once by _sort_parsed_entities() when the parse result is stored,
+    so insort keeps them sorted without a full re-sort.
+    """
+    def bucket(category: str) -> List[str]:
+        return parsed["factions"] if category == "factions" else parsed["entities"][category]
+
+    bucket(src).remove(name)
+    if dst is not None:
+        bisect.insort(bucket(dst), name)
+
+
 def _save_override_promote_to_faction(campaign_id: str, entity_name: str, from_category: str) -> None:
     """Helper to save promotion to faction in overrides."""
     overrides = ImportOverrides.load(campaign_id)
@@ -265,23 +649,24 @@ def render_campaign_selector() -> None:
             
             if submitted and campaign_name:
                 # Create new campaign
-                campaign_id = f"campaign_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-                timestamp = datetime.now().isoformat()
+                now = datetime.now()
+                campaign_id = f"campaign_{now.strftime('%Y%m%d_%H%M%S')}"
+                timestamp = now.isoformat()
                 
                 # Initialize campaign state
                 campaign_state = CampaignState.default()
                 
                 # Add initial factions if provided
-                initial_factions = {}
-                for f_name in [faction1, faction2, faction3, faction4]:
-                    if f_name:
-                        fid = f_name.lower().replace(" ", "_")
-                        initial_factions[fid] = FactionState(
-                            faction_id=fid,
-                            attention=0,
-                            disposition=0,
-                            notes=f_name,  # Store display name in notes
-                        )
+                initial_factions = {
+                    (fid := _faction_id(f_name)): FactionState(
+                        faction_id=fid,
+                        attention=0,
+                        disposition=0,
+                        notes=f_name,  # Store display name in notes
+                    )
+                    for f_name in [faction1, faction2, faction3, faction4]
+                    if f_name
+                }
                 
                 if initial_factions:
                     from spar_campaign.campaign import apply_campaign_delta
@@ -330,7 +715,7 @@ def render_campaign_selector() -> None:
             if history_text:
                 from streamlit_harness.history_parser import parse_campaign_history
                 parsed = parse_campaign_history(history_text)
-                st.session_state.parsed_history = parsed
+                st.session_state.parsed_history = _sort_parsed_entities(parsed)
         
         # Show parse preview if available
         if st.session_state.get("parsed_history"):
@@ -367,36 +752,19 @@ def render_campaign_selector() -> None:
                             st.write(f"• {faction}")
                         with col2:
                             if st.button("→Place", key=f"f_place_{idx}", help="Demote to Place"):
-                                factions = list(parsed["factions"])
-                                factions.remove(faction)
-                                places = list(parsed["entities"]["places"])
-                                places.append(faction)
-                                st.session_state.parsed_history["factions"] = sorted(factions)
-                                st.session_state.parsed_history["entities"]["places"] = sorted(places)
+                                _reclassify_entity(parsed, faction, "factions", "places")
                                 st.rerun()
                         with col3:
                             if st.button("→Artifact", key=f"f_art_{idx}", help="Demote to Artifact"):
-                                factions = list(parsed["factions"])
-                                factions.remove(faction)
-                                artifacts = list(parsed["entities"]["artifacts"])
-                                artifacts.append(faction)
-                                st.session_state.parsed_history["factions"] = sorted(factions)
-                                st.session_state.parsed_history["entities"]["artifacts"] = sorted(artifacts)
+                                _reclassify_entity(parsed, faction, "factions", "artifacts")
                                 st.rerun()
                         with col4:
                             if st.button("→Concept", key=f"f_con_{idx}", help="Demote to Concept"):
-                                factions = list(parsed["factions"])
-                                factions.remove(faction)
-                                concepts = list(parsed["entities"]["concepts"])
-                                concepts.append(faction)
-                                st.session_state.parsed_history["factions"] = sorted(factions)
-                                st.session_state.parsed_history["entities"]["concepts"] = sorted(concepts)
+                                _reclassify_entity(parsed, faction, "factions", "concepts")
                                 st.rerun()
                         with col5:
                             if st.button("✕", key=f"f_rem_{idx}", help="Remove"):
-                                factions = list(parsed["factions"])
-                                factions.remove(faction)
-                                st.session_state.parsed_history["factions"] = sorted(factions)
+                                _reclassify_entity(parsed, faction, "factions")
                                 st.rerun()
                 else:
                     st.caption("No factions detected")
@@ -413,36 +781,19 @@ def render_campaign_selector() -> None:
                                 st.caption(f"• {place}")
                             with col2:
                                 if st.button("↑Faction", key=f"p_fac_{idx}", help="Promote to Faction"):
-                                    places = list(parsed["entities"]["places"])
-                                    places.remove(place)
-                                    factions = list(parsed["factions"])
-                                    factions.append(place)
-                                    st.session_state.parsed_history["entities"]["places"] = sorted(places)
-                                    st.session_state.parsed_history["factions"] = sorted(factions)
+                                    _reclassify_entity(parsed, place, "places", "factions")
                                     st.rerun()
                             with col3:
                                 if st.button("→Artifact", key=f"p_art_{idx}", help="Change to Artifact"):
-                                    places = list(parsed["entities"]["places"])
-                                    places.remove(place)
-                                    artifacts = list(parsed["entities"]["artifacts"])
-                                    artifacts.append(place)
-                                    st.session_state.parsed_history["entities"]["places"] = sorted(places)
-                                    st.session_state.parsed_history["entities"]["artifacts"] = sorted(artifacts)
+                                    _reclassify_entity(parsed, place, "places", "artifacts")
                                     st.rerun()
                             with col4:
                                 if st.button("→Concept", key=f"p_con_{idx}", help="Change to Concept"):
-                                    places = list(parsed["entities"]["places"])
-                                    places.remove(place)
-                                    concepts = list(parsed["entities"]["concepts"])
-                                    concepts.append(place)
-                                    st.session_state.parsed_history["entities"]["places"] = sorted(places)
-                                    st.session_state.parsed_history["entities"]["concepts"] = sorted(concepts)
+                                    _reclassify_entity(parsed, place, "places", "concepts")
                                     st.rerun()
                             with col5:
                                 if st.button("✕", key=f"p_rem_{idx}", help="Remove"):
-                                    places = list(parsed["entities"]["places"])
-                                    places.remove(place)
-                                    st.session_state.parsed_history["entities"]["places"] = sorted(places)
+                                    _reclassify_entity(parsed, place, "places")
                                     st.rerun()
                     if entities.get("artifacts"):
                         st.markdown("**Artifacts:**")
@@ -452,36 +803,19 @@ def render_campaign_selector() -> None:
                                 st.caption(f"• {artifact}")
                             with col2:
                                 if st.button("↑Faction", key=f"a_fac_{idx}", help="Promote to Faction"):
-                                    artifacts = list(parsed["entities"]["artifacts"])
-                                    artifacts.remove(artifact)
-                                    factions = list(parsed["factions"])
-                                    factions.append(artifact)
-                                    st.session_state.parsed_history["entities"]["artifacts"] = sorted(artifacts)
-                                    st.session_state.parsed_history["factions"] = sorted(factions)
+                                    _reclassify_entity(parsed, artifact, "artifacts", "factions")
                                     st.rerun()
                             with col3:
                                 if st.button("→Place", key=f"a_pla_{idx}", help="Change to Place"):
-                                    artifacts = list(parsed["entities"]["artifacts"])
-                                    artifacts.remove(artifact)
-                                    places = list(parsed["entities"]["places"])
-                                    places.append(artifact)
-                                    st.session_state.parsed_history["entities"]["artifacts"] = sorted(artifacts)
-                                    st.session_state.parsed_history["entities"]["places"] = sorted(places)
+                                    _reclassify_entity(parsed, artifact, "artifacts", "places")
                                     st.rerun()
                             with col4:
                                 if st.button("→Concept", key=f"a_con_{idx}", help="Change to Concept"):
-                                    artifacts = list(parsed["entities"]["artifacts"])
-                                    artifacts.remove(artifact)
-                                    concepts = list(parsed["entities"]["concepts"])
-                                    concepts.append(artifact)
-                                    st.session_state.parsed_history["entities"]["artifacts"] = sorted(artifacts)
-                                    st.session_state.parsed_history["entities"]["concepts"] = sorted(concepts)
+                                    _reclassify_entity(parsed, artifact, "artifacts", "concepts")
                                     st.rerun()
                             with col5:
                                 if st.button("✕", key=f"a_rem_{idx}", help="Remove"):
-                                    artifacts = list(parsed["entities"]["artifacts"])
-                                    artifacts.remove(artifact)
-                                    st.session_state.parsed_history["entities"]["artifacts"] = sorted(artifacts)
+                                    _reclassify_entity(parsed, artifact, "artifacts")
                                     st.rerun()
                     if entities.get("concepts"):
                         st.markdown("**Concepts/Powers:**")
@@ -491,36 +825,19 @@ def render_campaign_selector() -> None:
                                 st.caption(f"• {concept}")
                             with col2:
                                 if st.button("↑Faction", key=f"c_fac_{idx}", help="Promote to Faction"):
-                                    concepts = list(parsed["entities"]["concepts"])
-                                    concepts.remove(concept)
-                                    factions = list(parsed["factions"])
-                                    factions.append(concept)
-                                    st.session_state.parsed_history["entities"]["concepts"] = sorted(concepts)
-                                    st.session_state.parsed_history["factions"] = sorted(factions)
+                                    _reclassify_entity(parsed, concept, "concepts", "factions")
                                     st.rerun()
                             with col3:
                                 if st.button("→Place", key=f"c_pla_{idx}", help="Change to Place"):
-                                    concepts = list(parsed["entities"]["concepts"])
-                                    concepts.remove(concept)
-                                    places = list(parsed["entities"]["places"])
-                                    places.append(concept)
-                                    st.session_state.parsed_history["entities"]["concepts"] = sorted(concepts)
-                                    st.session_state.parsed_history["entities"]["places"] = sorted(places)
+                                    _reclassify_entity(parsed, concept, "concepts", "places")
                                     st.rerun()
                             with col4:
                                 if st.button("→Artifact", key=f"c_art_{idx}", help="Change to Artifact"):
-                                    concepts = list(parsed["entities"]["concepts"])
-                                    concepts.remove(concept)
-                                    artifacts = list(parsed["entities"]["artifacts"])
-                                    artifacts.append(concept)
-                                    st.session_state.parsed_history["entities"]["concepts"] = sorted(concepts)
-                                    st.session_state.parsed_history["entities"]["artifacts"] = sorted(artifacts)
+                                    _reclassify_entity(parsed, concept, "concepts", "artifacts")
                                     st.rerun()
                             with col5:
                                 if st.button("✕", key=f"c_rem_{idx}", help="Remove"):
-                                    concepts = list(parsed["entities"]["concepts"])
-                                    concepts.remove(concept)
-                                    st.session_state.parsed_history["entities"]["concepts"] = sorted(concepts)
+                                    _reclassify_entity(parsed, concept, "concepts")
                                     st.rerun()
             
             # Show future sessions (not imported)
@@ -539,86 +856,101 @@ def render_campaign_selector() -> None:
                         st.caption(f"• {thread[:150]}..." if len(thread) > 150 else f"• {thread}")
             
             # Create campaign from parsed history
-            campaign_name_import = st.text_input("Campaign Name", value="Imported Campaign")
+            # Name edits apply on submit instead of rerunning the whole selector
+            with st.form("create_from_history_form", border=False):
+                campaign_name_import = st.text_input("Campaign Name", value="Imported Campaign")
+                
+                col1, col2 = st.columns(2)
+                with col1:
+                    create_from_history = st.form_submit_button("Create Campaign from History", type="primary")
+                with col2:
+                    cancel_import = st.form_submit_button("Cancel")
             
-            col1, col2 = st.columns(2)
-            with col1:
-                if st.button("Create Campaign from History", type="primary"):
-                    # Create campaign with parsed data
-                    campaign_id = f"campaign_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-                    timestamp = datetime.now().isoformat()
-                    
-                    # Initialize state with detected factions
-                    campaign_state = CampaignState.default()
-                    initial_factions = {}
-                    for f_name in parsed["factions"]:
-                        fid = f_name.lower().replace(" ", "_")
-                        initial_factions[fid] = FactionState(
-                            faction_id=fid,
-                            attention=0,
-                            disposition=0,
-                            notes=f_name,
-                        )
-                    
-                    if initial_factions:
-                        campaign_state = CampaignState(
-                            version="0.2",
-                            campaign_pressure=0,
-                            heat=0,
-                            scars=[],
-                            factions=initial_factions,
-                            total_scenes_run=len(parsed["sessions"]),
-                            total_cutoffs_seen=0,
-                            highest_severity_seen=0,
-                            _legacy_scars=set(),
-                        )
-                    
-                    # Create ledger from parsed sessions
-                    ledger = []
-                    for session in parsed["sessions"]:
-                        ledger.append({
-                            "session_number": session["session_number"],
-                            "session_date": session["date"],
-                            "what_happened": [session["content"][:200]],  # Truncate
-                            "deltas": {"pressure_change": 0, "heat_change": 0},
-                            "active_sources": [],
-                        })
-                    
-                    campaign = Campaign(
-                        campaign_id=campaign_id,
-                        name=campaign_name_import,
-                        created=timestamp,
-                        last_played=timestamp,
-                        canon_summary=parsed["canon_summary"],
-                        campaign_state=campaign_state,
-                        ledger=ledger,
+            if create_from_history:
+                # Create campaign with parsed data
+                now = datetime.now()
+                campaign_id = f"campaign_{now.strftime('%Y%m%d_%H%M%S')}"
+                timestamp = now.isoformat()
+                
+                # Initialize state with detected factions
+                campaign_state = CampaignState.default()
+                initial_factions = {
+                    (fid := _faction_id(f_name)): FactionState(
+                        faction_id=fid,
+                        attention=0,
+                        disposition=0,
+                        notes=f_name,
                     )
-                    
-                    campaign.save()
-                    
-                    # Initialize empty import overrides file for new campaign
-                    overrides = ImportOverrides(campaign_id=campaign_id)
-                    overrides.save()
-                    
-                    st.session_state.current_campaign_id = campaign_id
-                    st.session_state.show_history_import = False
-                    st.session_state.parsed_history = None
-                    st.session_state.campaign_page = "dashboard"
-                    st.success(f"Campaign '{campaign_name_import}' created from history!")
-                    st.rerun()
+                    for f_name in parsed["factions"]
+                }
+                
+                if initial_factions:
+                    campaign_state = CampaignState(
+                        version="0.2",
+                        campaign_pressure=0,
+                        heat=0,
+                        scars=[],
+                        factions=initial_factions,
+                        total_scenes_run=len(parsed["sessions"]),
+                        total_cutoffs_seen=0,
+                        highest_severity_seen=0,
+                        _legacy_scars=set(),
+                    )
+                
+                # Create ledger from parsed sessions
+                ledger = []
+                for session in parsed["sessions"]:
+                    ledger.append({
+                        "session_number": session["session_number"],
+                        "session_date": session["date"],
+                        "what_happened": [session["content"][:200]],  # Truncate
+                        "deltas": {"pressure_change": 0, "heat_change": 0},
+                        "active_sources": [],
+                    })
+                
+                campaign = Campaign(
+                    campaign_id=campaign_id,
+                    name=campaign_name_import,
+                    created=timestamp,
+                    last_played=timestamp,
+                    canon_summary=parsed["canon_summary"],
+                    campaign_state=campaign_state,
+                    ledger=ledger,
+                )
+                
+                campaign.save()
+                
+                # Initialize empty import overrides file for new campaign
+                overrides = ImportOverrides(campaign_id=campaign_id)
+                overrides.save()
+                
+                st.session_state.current_campaign_id = campaign_id
+                st.session_state.show_history_import = False
+                st.session_state.parsed_history = None
+                st.session_state.campaign_page = "dashboard"
+                st.success(f"Campaign '{campaign_name_import}' created from history!")
+                st.rerun()
             
-            with col2:
-                if st.button("Cancel"):
-                    st.session_state.show_history_import = False
-                    st.session_state.parsed_history = None
-                    st.rerun()
+            if cancel_import:
+                st.session_state.show_history_import = False
+                st.session_state.parsed_history = None
+                st.rerun()
     
     st.divider()
     
     # List existing campaigns
-    st.subheader("Your Campaigns")
+    col1, col2 = st.columns([5, 1])
+    with col1:
+        st.subheader("Your Campaigns")
+    with col2:
+        st.button(
+            "↻ Refresh",
+            use_container_width=True,
+            help="Re-read every campaign file from disk",
+            on_click=_cached_list_all.clear,
+        )
     
-    campaigns = Campaign.list_all()
+    campaigns = list_campaigns(limit=SELECTOR_CAMPAIGN_LIMIT)
     
     if not campaigns:
         st.info("No campaigns yet. Create your first campaign above!")
@@ -633,47 +965,124 @@ def render_campaign_selector() -> None:
                 st.caption(f"Last played: {campaign.last_played[:10]}")
                 
                 # Show pressure/heat bands if campaign state exists
-                if campaign.campaign_state:
-                    pressure_band = campaign.campaign_state.get_pressure_band()
-                    heat_band = campaign.campaign_state.get_heat_band()
+                if campaign.has_state:
+                    pressure_band = campaign.pressure_band
+                    heat_band = campaign.heat_band
                     
                     # Badge styling
-                    pressure_color = {
-                        "stable": "🟢",
-                        "strained": "🟡",
-                        "volatile": "🟠",
-                        "critical": "🔴"
-                    }.get(pressure_band, "⚪")
+                    pressure_color, pressure_title = PRESSURE_BAND_LABELS[pressure_band]
+                    heat_color, heat_title = HEAT_BAND_LABELS[heat_band]
                     
-                    heat_color = {
-                        "quiet": "🔵",
-                        "noticed": "🟡",
-                        "hunted": "🟠",
-                        "exposed": "🔴"
-                    }.get(heat_band, "⚪")
-                    
-                    st.caption(f"{pressure_color} {pressure_band.title()} | {heat_color} {heat_band.title()}")
+                    st.caption(f"{pressure_color} {pressure_title} | {heat_color} {heat_title}")
             
             with col2:
-                if campaign.campaign_state:
-                    st.caption(f"Sessions: {campaign.campaign_state.total_scenes_run}")
-                    if campaign.campaign_state.scars:
-                        st.caption(f"Scars: {len(campaign.campaign_state.scars)}")
-                    if campaign.campaign_state.factions:
-                        active_factions = sum(1 for f in campaign.campaign_state.factions.values() if f.attention > 0)
-                        st.caption(f"Active Factions: {active_factions}/{len(campaign.campaign_state.factions)}")
+                if campaign.has_state:
+                    st.caption(f"Sessions: {campaign.total_scenes_run}")
+                    if campaign.scars_count:
+                        st.caption(f"Scars: {campaign.scars_count}")
+                    if campaign.total_factions:
+                        st.caption(f"Active Factions: {campaign.active_factions}/{campaign.total_factions}")
             
             with col3:
-                if st.button("Open →", key=f"open_{campaign.campaign_id}", use_container_width=True):
-                    st.session_state.current_campaign_id = campaign.campaign_id
-                    st.session_state.campaign_page = "dashboard"
-                    st.rerun()
+                st.button(
+                    "Open →",
+                    key=f"open_{campaign.campaign_id}",
+                    use_container_width=True,
+                    on_click=_go_to_page,
+                    args=("dashboard",),
+                    kwargs={"current_campaign_id": campaign.campaign_id},
+                )
+
+
+@st.fragment
+def render_sources_panel(campaign_id: str) -> None:
+    """Content Sources expander on the dashboard.
+
+    Runs as a fragment so opening the add-source form and typing into it
+    rerun only this panel. Changes to the source list trigger a full run.
+    """
+    campaign = load_campaign(campaign_id)
+    if campaign is None:
+        return
+    
+    with st.expander(f"📚 Content Sources ({len(campaign.active_sources())} active)", expanded=False):
+        st.caption("Content sources for this campaign (no parsing yet, metadata only)")
+        
+        # Show built-in source
+        st.markdown("**core_complications** (built-in)")
+        st.caption("✅ Always active | data/core_complications.json")
+        st.divider()
+        
+        # Show campaign sources
+        if campaign.sources:
+            for source in campaign.sources:
+                col1, col2, col3 = st.columns([6, 3, 1])
+                
+                with col1:
+                    status = "✅" if source.enabled else "⏸️"
+                    st.markdown(f"{status} **{source.name}**")
+                    st.caption(f"{source.path}")
+                    if source.notes:
+                        st.caption(f"_{source.notes}_")
+                
+                with col2:
+                    st.caption(source.source_type)
+                
+                with col3:
+                    # Toggle enabled state
+                    if st.button("⚙️", key=f"toggle_source_{source.source_id}"):
+                        source.enabled = not source.enabled  # Source is mutable
+                        campaign.save()
+                        st.rerun()  # Full run: the header lists active sources
+                
+                st.divider()
+        
+        # Add new source form
+        if st.button("➕ Add Source"):
+            st.session_state.show_add_source_form = True
+        
+        if st.session_state.get("show_add_source_form", False):
+            st.markdown("**Add New Source**")
+            
+            # Inputs apply together on Add/Cancel instead of rerunning per field
+            with st.form("add_source_form", border=False):
+                new_source_name = st.text_input("Source Name", placeholder="e.g., City Loot Table", key="new_source_name")
+                new_source_path = st.text_input("File Path", placeholder="e.g., data/city_loot.csv", key="new_source_path")
+                new_source_notes = st.text_input("Notes (optional)", placeholder="e.g., Urban encounters", key="new_source_notes")
+                
+                col1, col2 = st.columns(2)
+                with col1:
+                    add_source = st.form_submit_button("Add", key="add_source_confirm")
+                with col2:
+                    cancel_source = st.form_submit_button("Cancel", key="add_source_cancel")
+            
+            if add_source:
+                if new_source_name and new_source_path:
+                    source_id = f"source_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+                    new_source = Source(
+                        source_id=source_id,
+                        name=new_source_name,
+                        path=new_source_path,
+                        enabled=True,
+                        source_type="external",
+                        notes=new_source_notes if new_source_notes else None,
+                    )
+                    campaign.sources.append(new_source)
+                    campaign.save()
+                    st.session_state.show_add_source_form = False
+                    st.rerun()  # Full run: the header lists active sources
+                else:
+                    st.error("Name and path required")
+
+            if cancel_source:
+                st.session_state.show_add_source_form = False
+                st.rerun(scope="fragment")
 
 
 def render_campaign_dashboard() -> None:
     """Campaign dashboard - living state view (main campaign page)."""
     campaign_id = st.session_state.current_campaign_id
-    campaign = Campaign.load(campaign_id)
+    campaign = load_campaign(campaign_id)
     
     if not campaign:
         st.error("Campaign not found")
@@ -684,15 +1093,12 @@ def render_campaign_dashboard() -> None:
     # Header with back button
     col1, col2 = st.columns([1, 11])
     with col1:
-        if st.button("← Back"):
-            st.session_state.campaign_page = "selector"
-            st.session_state.current_campaign_id = None
-            st.rerun()
+        st.button("← Back", on_click=_go_to_page, args=("selector",), kwargs={"current_campaign_id": None})
     with col2:
         st.title(f"📖 {campaign.name}")
     
     # Show active sources in header
-    active_sources = [s for s in campaign.sources if s.enabled]
+    active_sources = campaign.active_sources()
     if active_sources:
         source_names = ", ".join([s.name for s in active_sources])
         st.caption(f"Active Sources: {source_names}")
@@ -702,15 +1108,15 @@ def render_campaign_dashboard() -> None:
     st.caption(f"Campaign ID: {campaign.campaign_id} | Last played: {campaign.last_played[:16]}")
     
     # Primary action button
-    if st.button("▶️ Run Session", type="primary", use_container_width=True):
-        st.session_state.campaign_page = "session"
-        st.rerun()
+    st.button("▶️ Run Session", type="primary", use_container_width=True, on_click=_go_to_page, args=("session",))
     
     st.divider()
     
     # Campaign State Overview
     if campaign.campaign_state:
         cs = campaign.campaign_state
+        cs_pressure_band = _pressure_band(cs.campaign_pressure)
+        cs_heat_band = _heat_band(cs.heat)
         
         col1, col2, col3, col4 = st.columns(4)
         
@@ -718,17 +1124,17 @@ def render_campaign_dashboard() -> None:
             st.metric(
                 "Campaign Pressure",
                 cs.campaign_pressure,
-                help=f"Band: {cs.get_pressure_band()}"
+                help=f"Band: {cs_pressure_band}"
             )
-            st.caption(f"🎚️ {cs.get_pressure_band().title()}")
+            st.caption(f"🎚️ {PRESSURE_BAND_LABELS[cs_pressure_band][1]}")
         
         with col2:
             st.metric(
                 "Heat",
                 cs.heat,
-                help=f"Band: {cs.get_heat_band()}"
+                help=f"Band: {cs_heat_band}"
             )
-            st.caption(f"🌡️ {cs.get_heat_band().title()}")
+            st.caption(f"🌡️ {HEAT_BAND_LABELS[cs_heat_band][1]}")
         
         with col3:
             st.metric("Sessions", cs.total_scenes_run)
@@ -747,110 +1153,33 @@ def render_campaign_dashboard() -> None:
     # Display as editable bullet list
     st.caption("Current state of the world (8-12 bullets recommended)")
     
-    for idx, bullet in enumerate(campaign.canon_summary[:15]):  # Cap at 15
-        col1, col2 = st.columns([11, 1])
-        with col1:
-            new_text = st.text_input(
-                f"Canon {idx+1}",
-                value=bullet,
-                key=f"canon_bullet_{idx}",
-                label_visibility="collapsed"
-            )
-            if new_text != bullet:
-                campaign.canon_summary[idx] = new_text
-                campaign.save()
-        with col2:
-            if st.button("🗑️", key=f"delete_canon_{idx}"):
-                campaign.canon_summary.pop(idx)
-                campaign.save()
-                st.rerun()
+    # One editor in a form: typing, adding and deleting rows stay client-side
+    # until Update, which saves once
+    with st.form("canon_form", border=False):
+        edited = st.data_editor(
+            [{"bullet": bullet} for bullet in campaign.canon_summary],
+            column_config={"bullet": st.column_config.TextColumn("Canon", width="large")},
+            num_rows="dynamic",
+            hide_index=True,
+            use_container_width=True,
+            key=_canon_editor_key(campaign.canon_summary),
+        )
+        update_canon = st.form_submit_button("💾 Update Canon")
     
-    if st.button("➕ Add Canon Bullet"):
-        campaign.canon_summary.append("New development...")
-        campaign.save()
-        st.rerun()
+    if update_canon:
+        new_bullets = [row["bullet"] for row in edited if (row.get("bullet") or "").strip()]
+        if new_bullets != campaign.canon_summary:
+            campaign.canon_summary = new_bullets
+            campaign.save()
     
     st.divider()
     
     # Sources Management
-    with st.expander(f"📚 Content Sources ({len([s for s in campaign.sources if s.enabled])} active)", expanded=False):
-        st.caption("Content sources for this campaign (no parsing yet, metadata only)")
-        
-        # Show built-in source
-        st.markdown("**core_complications** (built-in)")
-        st.caption("✅ Always active | data/core_complications.json")
-        st.divider()
-        
-        # Show campaign sources
-        if campaign.sources:
-            for idx, source in enumerate(campaign.sources):
-                col1, col2, col3 = st.columns([6, 3, 1])
-                
-                with col1:
-                    status = "✅" if source.enabled else "⏸️"
-                    st.markdown(f"{status} **{source.name}**")
-                    st.caption(f"{source.path}")
-                    if source.notes:
-                        st.caption(f"_{source.notes}_")
-                
-                with col2:
-                    st.caption(source.source_type)
-                
-                with col3:
-                    # Toggle enabled state
-                    if st.button("⚙️", key=f"toggle_source_{source.source_id}"):
-                        campaign.sources[idx] = Source(
-                            source_id=source.source_id,
-                            name=source.name,
-                            path=source.path,
-                            enabled=not source.enabled,
-                            source_type=source.source_type,
-                            notes=source.notes,
-                        )
-                        campaign.save()
-                        st.rerun()
-                
-                st.divider()
-        
-        # Add new source form
-        if st.button("➕ Add Source"):
-            st.session_state.show_add_source_form = True
-        
-        if st.session_state.get("show_add_source_form", False):
-            st.markdown("**Add New Source**")
-            
-            new_source_name = st.text_input("Source Name", placeholder="e.g., City Loot Table", key="new_source_name")
-            new_source_path = st.text_input("File Path", placeholder="e.g., data/city_loot.csv", key="new_source_path")
-            new_source_notes = st.text_input("Notes (optional)", placeholder="e.g., Urban encounters", key="new_source_notes")
-            
-            col1, col2 = st.columns(2)
-            with col1:
-                if st.button("Add", key="add_source_confirm"):
-                    if new_source_name and new_source_path:
-                        source_id = f"source_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-                        new_source = Source(
-                            source_id=source_id,
-                            name=new_source_name,
-                            path=new_source_path,
-                            enabled=True,
-                            source_type="external",
-                            notes=new_source_notes if new_source_notes else None,
-                        )
-                        campaign.sources.append(new_source)
-                        campaign.save()
-                        st.session_state.show_add_source_form = False
-                        st.rerun()
-                    else:
-                        st.error("Name and path required")
-            
-            with col2:
-                if st.button("Cancel", key="add_source_cancel"):
-                    st.session_state.show_add_source_form = False
-                    st.rerun()
+    render_sources_panel(campaign_id)
     
     # Scars
     if campaign.campaign_state and campaign.campaign_state.scars:
-        with st.expander(f"🩹 Scars ({len(campaign.campaign_state.scars)})", expanded=False):
+        if _lazy_section(f"🩹 Scars ({len(campaign.campaign_state.scars)})", "_exp_scars_open"):
             for scar in campaign.campaign_state.scars:
                 st.markdown(f"**{scar.scar_id}** ({scar.category}, {scar.severity})")
                 if scar.notes:
@@ -862,13 +1191,7 @@ def render_campaign_dashboard() -> None:
     if campaign.campaign_state and campaign.campaign_state.factions:
         with st.expander(f"👥 Factions ({len(campaign.campaign_state.factions)})", expanded=True):
             for fid, faction in campaign.campaign_state.factions.items():
-                disp_str = {
-                    -2: "😡 Hostile",
-                    -1: "😠 Unfriendly",
-                    0: "😐 Neutral",
-                    1: "🙂 Friendly",
-                    2: "😊 Allied"
-                }.get(faction.disposition, "Unknown")
+                disp_str = DISPOSITION_LABELS.get(faction.disposition, "Unknown")
                 
                 display_name = faction.notes or fid
                 st.markdown(f"**{display_name}**")
@@ -915,7 +1238,7 @@ def render_campaign_dashboard() -> None:
                     if st.button("Parse"):
                         if history_text:
                             from streamlit_harness.history_parser import parse_campaign_history
-                            st.session_state.dashboard_parsed = parse_campaign_history(history_text)
+                            st.session_state.dashboard_parsed = _sort_parsed_entities(parse_campaign_history(history_text))
                 with col2:
                     if st.button("Clear"):
                         st.session_state.show_dashboard_history_import = False
@@ -960,39 +1283,22 @@ def render_campaign_dashboard() -> None:
                                 with col2:
                                     if st.button("→Place", key=f"d_f_place_{idx}", help="Demote to Place"):
                                         _save_override_demote_from_faction(campaign_id, faction, "place")
-                                        factions = list(parsed["factions"])
-                                        factions.remove(faction)
-                                        places = list(parsed["entities"]["places"])
-                                        places.append(faction)
-                                        st.session_state.dashboard_parsed["factions"] = sorted(factions)
-                                        st.session_state.dashboard_parsed["entities"]["places"] = sorted(places)
+                                        _reclassify_entity(parsed, faction, "factions", "places")
                                         st.rerun()
                                 with col3:
                                     if st.button("→Artifact", key=f"d_f_art_{idx}", help="Demote to Artifact"):
                                         _save_override_demote_from_faction(campaign_id, faction, "artifact")
-                                        factions = list(parsed["factions"])
-                                        factions.remove(faction)
-                                        artifacts = list(parsed["entities"]["artifacts"])
-                                        artifacts.append(faction)
-                                        st.session_state.dashboard_parsed["factions"] = sorted(factions)
-                                        st.session_state.dashboard_parsed["entities"]["artifacts"] = sorted(artifacts)
+                                        _reclassify_entity(parsed, faction, "factions", "artifacts")
                                         st.rerun()
                                 with col4:
                                     if st.button("→Concept", key=f"d_f_con_{idx}", help="Demote to Concept"):
                                         _save_override_demote_from_faction(campaign_id, faction, "concept")
-                                        factions = list(parsed["factions"])
-                                        factions.remove(faction)
-                                        concepts = list(parsed["entities"]["concepts"])
-                                        concepts.append(faction)
-                                        st.session_state.dashboard_parsed["factions"] = sorted(factions)
-                                        st.session_state.dashboard_parsed["entities"]["concepts"] = sorted(concepts)
+                                        _reclassify_entity(parsed, faction, "factions", "concepts")
                                         st.rerun()
                                 with col5:
                                     if st.button("✕", key=f"d_f_rem_{idx}", help="Remove"):
                                         _save_override_remove(campaign_id, faction)
-                                        factions = list(parsed["factions"])
-                                        factions.remove(faction)
-                                        st.session_state.dashboard_parsed["factions"] = sorted(factions)
+                                        _reclassify_entity(parsed, faction, "factions")
                                         st.rerun()
                         else:
                             st.caption("No factions detected")
@@ -1010,39 +1316,22 @@ def render_campaign_dashboard() -> None:
                                     with col2:
                                         if st.button("↑Faction", key=f"d_p_fac_{idx}", help="Promote to Faction"):
                                             _save_override_promote_to_faction(campaign_id, place, "place")
-                                            places = list(parsed["entities"]["places"])
-                                            places.remove(place)
-                                            factions = list(parsed["factions"])
-                                            factions.append(place)
-                                            st.session_state.dashboard_parsed["entities"]["places"] = sorted(places)
-                                            st.session_state.dashboard_parsed["factions"] = sorted(factions)
+                                            _reclassify_entity(parsed, place, "places", "factions")
                                             st.rerun()
                                     with col3:
                                         if st.button("→Artifact", key=f"d_p_art_{idx}", help="Change to Artifact"):
                                             _save_override_lateral_move(campaign_id, place, "artifact")
-                                            places = list(parsed["entities"]["places"])
-                                            places.remove(place)
-                                            artifacts = list(parsed["entities"]["artifacts"])
-                                            artifacts.append(place)
-                                            st.session_state.dashboard_parsed["entities"]["places"] = sorted(places)
-                                            st.session_state.dashboard_parsed["entities"]["artifacts"] = sorted(artifacts)
+                                            _reclassify_entity(parsed, place, "places", "artifacts")
                                             st.rerun()
                                     with col4:
                                         if st.button("→Concept", key=f"d_p_con_{idx}", help="Change to Concept"):
                                             _save_override_lateral_move(campaign_id, place, "concept")
-                                            places = list(parsed["entities"]["places"])
-                                            places.remove(place)
-                                            concepts = list(parsed["entities"]["concepts"])
-                                            concepts.append(place)
-                                            st.session_state.dashboard_parsed["entities"]["places"] = sorted(places)
-                                            st.session_state.dashboard_parsed["entities"]["concepts"] = sorted(concepts)
+                                            _reclassify_entity(parsed, place, "places", "concepts")
                                             st.rerun()
                                     with col5:
                                         if st.button("✕", key=f"d_p_rem_{idx}", help="Remove"):
                                             _save_override_remove(campaign_id, place)
-                                            places = list(parsed["entities"]["places"])
-                                            places.remove(place)
-                                            st.session_state.dashboard_parsed["entities"]["places"] = sorted(places)
+                                            _reclassify_entity(parsed, place, "places")
                                             st.rerun()
                             if entities.get("artifacts"):
                                 st.markdown("**Artifacts:**")
@@ -1053,39 +1342,22 @@ def render_campaign_dashboard() -> None:
                                     with col2:
                                         if st.button("↑Faction", key=f"d_a_fac_{idx}", help="Promote to Faction"):
                                             _save_override_promote_to_faction(campaign_id, artifact, "artifact")
-                                            artifacts = list(parsed["entities"]["artifacts"])
-                                            artifacts.remove(artifact)
-                                            factions = list(parsed["factions"])
-                                            factions.append(artifact)
-                                            st.session_state.dashboard_parsed["entities"]["artifacts"] = sorted(artifacts)
-                                            st.session_state.dashboard_parsed["factions"] = sorted(factions)
+                                            _reclassify_entity(parsed, artifact, "artifacts", "factions")
                                             st.rerun()
                                     with col3:
                                         if st.button("→Place", key=f"d_a_pla_{idx}", help="Change to Place"):
                                             _save_override_lateral_move(campaign_id, artifact, "place")
-                                            artifacts = list(parsed["entities"]["artifacts"])
-                                            artifacts.remove(artifact)
-                                            places = list(parsed["entities"]["places"])
-                                            places.append(artifact)
-                                            st.session_state.dashboard_parsed["entities"]["artifacts"] = sorted(artifacts)
-                                            st.session_state.dashboard_parsed["entities"]["places"] = sorted(places)
+                                            _reclassify_entity(parsed, artifact, "artifacts", "places")
                                             st.rerun()
                                     with col4:
                                         if st.button("→Concept", key=f"d_a_con_{idx}", help="Change to Concept"):
                                             _save_override_lateral_move(campaign_id, artifact, "concept")
-                                            artifacts = list(parsed["entities"]["artifacts"])
-                                            artifacts.remove(artifact)
-                                            concepts = list(parsed["entities"]["concepts"])
-                                            concepts.append(artifact)
-                                            st.session_state.dashboard_parsed["entities"]["artifacts"] = sorted(artifacts)
-                                            st.session_state.dashboard_parsed["entities"]["concepts"] = sorted(concepts)
+                                            _reclassify_entity(parsed, artifact, "artifacts", "concepts")
                                             st.rerun()
                                     with col5:
                                         if st.button("✕", key=f"d_a_rem_{idx}", help="Remove"):
                                             _save_override_remove(campaign_id, artifact)
-                                            artifacts = list(parsed["entities"]["artifacts"])
-                                            artifacts.remove(artifact)
-                                            st.session_state.dashboard_parsed["entities"]["artifacts"] = sorted(artifacts)
+                                            _reclassify_entity(parsed, artifact, "artifacts")
                                             st.rerun()
                             if entities.get("concepts"):
                                 st.markdown("**Concepts/Powers:**")
@@ -1096,39 +1368,22 @@ def render_campaign_dashboard() -> None:
                                     with col2:
                                         if st.button("↑Faction", key=f"d_c_fac_{idx}", help="Promote to Faction"):
                                             _save_override_promote_to_faction(campaign_id, concept, "concept")
-                                            concepts = list(parsed["entities"]["concepts"])
-                                            concepts.remove(concept)
-                                            factions = list(parsed["factions"])
-                                            factions.append(concept)
-                                            st.session_state.dashboard_parsed["entities"]["concepts"] = sorted(concepts)
-                                            st.session_state.dashboard_parsed["factions"] = sorted(factions)
+                                            _reclassify_entity(parsed, concept, "concepts", "factions")
                                             st.rerun()
                                     with col3:
                                         if st.button("→Place", key=f"d_c_pla_{idx}", help="Change to Place"):
                                             _save_override_lateral_move(campaign_id, concept, "place")
-                                            concepts = list(parsed["entities"]["concepts"])
-                                            concepts.remove(concept)
-                                            places = list(parsed["entities"]["places"])
-                                            places.append(concept)
-                                            st.session_state.dashboard_parsed["entities"]["concepts"] = sorted(concepts)
-                                            st.session_state.dashboard_parsed["entities"]["places"] = sorted(places)
+                                            _reclassify_entity(parsed, concept, "concepts", "places")
                                             st.rerun()
                                     with col4:
                                         if st.button("→Artifact", key=f"d_c_art_{idx}", help="Change to Artifact"):
                                             _save_override_lateral_move(campaign_id, concept, "artifact")
-                                            concepts = list(parsed["entities"]["concepts"])
-                                            concepts.remove(concept)
-                                            artifacts = list(parsed["entities"]["artifacts"])
-                                            artifacts.append(concept)
-                                            st.session_state.dashboard_parsed["entities"]["concepts"] = sorted(concepts)
-                                            st.session_state.dashboard_parsed["entities"]["artifacts"] = sorted(artifacts)
+                                            _reclassify_entity(parsed, concept, "concepts", "artifacts")
                                             st.rerun()
                                     with col5:
                                         if st.button("✕", key=f"d_c_rem_{idx}", help="Remove"):
                                             _save_override_remove(campaign_id, concept)
-                                            concepts = list(parsed["entities"]["concepts"])
-                                            concepts.remove(concept)
-                                            st.session_state.dashboard_parsed["entities"]["concepts"] = sorted(concepts)
+                                            _reclassify_entity(parsed, concept, "concepts")
                                             st.rerun()
                     
                     # Show future sessions (not imported)
@@ -1164,7 +1419,7 @@ def render_campaign_dashboard() -> None:
                             if campaign.campaign_state:
                                 new_factions = dict(campaign.campaign_state.factions)
                                 for f_name in parsed["factions"]:
-                                    fid = f_name.lower().replace(" ", "_")
+                                    fid = _faction_id(f_name)
                                     if fid not in new_factions:
                                         new_factions[fid] = FactionState(fid, 0, 0, f_name)
                                 
@@ -1186,7 +1441,7 @@ def render_campaign_dashboard() -> None:
                             st.success("History merged into campaign!")
                             st.rerun()
         
-        with st.expander(f"Existing Ledger Entries", expanded=False):
+        if _lazy_section("Existing Ledger Entries", "_exp_ledger_open"):
             for entry in reversed(campaign.ledger):  # Newest first
                 st.markdown(f"**Session {entry.get('session_number', '?')}** — {entry.get('session_date', '')}")
                 if entry.get("what_happened"):
@@ -1198,7 +1453,7 @@ def render_campaign_dashboard() -> None:
 def render_session_workspace() -> None:
     """Session workspace - run scenarios with campaign context."""
     campaign_id = st.session_state.current_campaign_id
-    campaign = Campaign.load(campaign_id)
+    campaign = load_campaign(campaign_id)
     
     if not campaign:
         st.error("Campaign not found")
@@ -1220,18 +1475,14 @@ def render_session_workspace() -> None:
     # Header
     col1, col2 = st.columns([1, 11])
     with col1:
-        if st.button("← Back"):
-            st.session_state.campaign_page = "dashboard"
-            st.rerun()
+        st.button("← Back", on_click=_go_to_page, args=("dashboard",))
     with col2:
         st.title(f"🎮 Session Workspace: {campaign.name}")
     
     st.info("🔧 Campaign context applied! Switch to Event Generator mode to run scenarios with campaign tags/factions pre-filled.")
     
     # Quick access to finalize
-    if st.button("✅ Finalize Session", type="primary", use_container_width=True):
-        st.session_state.campaign_page = "finalize"
-        st.rerun()
+    st.button("✅ Finalize Session", type="primary", use_container_width=True, on_click=_go_to_page, args=("finalize",))
     
     st.divider()
     
@@ -1239,8 +1490,8 @@ def render_session_workspace() -> None:
     with st.expander("📊 Campaign Context", expanded=False):
         if campaign.campaign_state:
             cs = campaign.campaign_state
-            st.write(f"**Pressure**: {cs.campaign_pressure} ({cs.get_pressure_band()})")
-            st.write(f"**Heat**: {cs.heat} ({cs.get_heat_band()})")
+            st.write(f"**Pressure**: {cs.campaign_pressure} ({_pressure_band(cs.campaign_pressure)})")
+            st.write(f"**Heat**: {cs.heat} ({_heat_band(cs.heat)})")
             
             from spar_campaign.campaign import get_campaign_influence
             influence = get_campaign_influence(cs)
@@ -1254,7 +1505,7 @@ def render_session_workspace() -> None:
 def render_finalize_session() -> None:
     """Finalize session wizard (2-3 clicks)."""
     campaign_id = st.session_state.current_campaign_id
-    campaign = Campaign.load(campaign_id)
+    campaign = load_campaign(campaign_id)
     
     if not campaign:
         st.error("Campaign not found")
@@ -1342,12 +1593,14 @@ def render_finalize_session() -> None:
                 st.stop()
             
             # Record active sources in session metadata
-            active_source_ids = [s.source_id for s in campaign.sources if s.enabled]
-            active_source_names = [s.name for s in campaign.sources if s.enabled]
+            active_sources = campaign.active_sources()
+            active_source_ids = [s.source_id for s in active_sources]
+            active_source_names = [s.name for s in active_sources]
             
+            session_date = datetime.now().isoformat()
             session_entry = {
                 "session_number": len(campaign.ledger) + 1,
-                "session_date": datetime.now().isoformat(),
+                "session_date": session_date,
                 "what_happened": what_happened,
                 "deltas": {
                     "pressure_change": pressure_change,
@@ -1364,11 +1617,13 @@ def render_finalize_session() -> None:
                 cs = campaign.campaign_state
                 
                 # Manual adjustments
-                new_pressure = max(0, min(30, cs.campaign_pressure + pressure_change))
-                new_heat = max(0, min(20, cs.heat + heat_change))
+                updates: Dict[str, Any] = {
+                    "campaign_pressure": max(0, min(30, cs.campaign_pressure + pressure_change)),
+                    "heat": max(0, min(20, cs.heat + heat_change)),
+                    "total_scenes_run": cs.total_scenes_run + 1,
+                }
                 
                 # Add scar if specified
-                new_scars = list(cs.scars)
                 if add_scar and scar_id:
                     new_scar = Scar(
                         scar_id=scar_id,
@@ -1378,32 +1633,21 @@ def render_finalize_session() -> None:
                         created_scene_index=cs.total_scenes_run,
                         notes=scar_notes if scar_notes else None,
                     )
-                    new_scars.append(new_scar)
+                    updates["scars"] = [*cs.scars, new_scar]
                 
                 # Update faction if specified
-                new_factions = dict(cs.factions)
                 if faction_attention and 'affected_faction' in locals() and affected_faction:
-                    if affected_faction in new_factions:
-                        old_faction = new_factions[affected_faction]
-                        new_factions[affected_faction] = FactionState(
-                            faction_id=old_faction.faction_id,
-                            attention=min(20, old_faction.attention + 2),
-                            disposition=old_faction.disposition,
-                            notes=old_faction.notes,
-                        )
+                    if affected_faction in cs.factions:
+                        old_faction = cs.factions[affected_faction]
+                        updates["factions"] = {
+                            **cs.factions,
+                            affected_faction: replace(
+                                old_faction, attention=min(20, old_faction.attention + 2)
+                            ),
+                        }
                 
-                # Create new state
-                campaign.campaign_state = CampaignState(
-                    version="0.2",
-                    campaign_pressure=new_pressure,
-                    heat=new_heat,
-                    scars=new_scars,
-                    factions=new_factions,
-                    total_scenes_run=cs.total_scenes_run + 1,
-                    total_cutoffs_seen=cs.total_cutoffs_seen,
-                    highest_severity_seen=cs.highest_severity_seen,
-                    _legacy_scars=cs._legacy_scars,
-                )
+                # New state; untouched scars/factions are shared, not copied
+                campaign.campaign_state = replace(cs, **updates)
             
             # Add to canon summary (first bullet becomes canon)
             if what_happened:
@@ -1411,7 +1655,7 @@ def render_finalize_session() -> None:
             
             # Add to ledger
             campaign.ledger.append(session_entry)
-            campaign.last_played = datetime.now().isoformat()
+            campaign.last_played = session_date
             
             # Save
             campaign.save()
@@ -6,6 +6,31 @@ from typing import Any, Dict, List, Optional
 from spar_engine.models import EngineState
 
 
+@dataclass
+class SidebarInputs:
+    """Event Generator sidebar selections.
+
+    Written by the sidebar fragment and read by the main body on full reruns,
+    so slider drags don't re-execute the Events/Scenarios tabs.
+    """
+    preset: str = "dungeon"
+    scene_id: str = "harness"
+    scene_phase: str = "engage"
+    party_band: str = "unknown"
+    rarity_mode: str = "normal"
+    confinement: float = 0.8
+    connectivity: float = 0.3
+    visibility: float = 0.6
+    pack_path: str = "data/core_complications.json"
+    seed: int = 42
+    tick_mode: str = "none"
+    ticks: int = 0
+    tick_between: bool = True
+    ticks_between_events: int = 1
+    include_tags_text: str = ""
+    exclude_tags_text: str = ""
+
+
 @dataclass
 class HarnessState:
     """Single source of truth for Streamlit harness session state.
@@ -17,17 +42,26 @@ class HarnessState:
     engine_state: EngineState = field(default_factory=EngineState.default)
     events: List[Dict[str, Any]] = field(default_factory=list)       # newest-first
     last_batch: List[Dict[str, Any]] = field(default_factory=list)
+    last_batch_summary: Optional[Dict[str, Any]] = None
     last_suite_report: Optional[Dict[str, Any]] = None
+    last_suite_summary: Any = None  # pd.DataFrame built once per report
 
     # Content pack cache
     pack_entries: List[Any] = field(default_factory=list)
     tag_vocab: List[str] = field(default_factory=list)
+    pack_load_attempted: bool = False
+    pack_load_error: Optional[str] = None
 
     # UI settings
     batch_n: int = 50
+    events_page: int = 0
+    inputs: SidebarInputs = field(default_factory=SidebarInputs)
 
     def reset(self) -> None:
         self.engine_state = EngineState.default()
         self.events = []
+        self.events_page = 0
         self.last_batch = []
+        self.last_batch_summary = None
         self.last_suite_report = None
+        self.last_suite_summary = None
@@ -0,0 +1,79 @@
+"""
+Tests for suite batch execution in the Streamlit harness.
+
+Tests cover:
+- Sequential and process-pool runs produce identical results
+- Results are returned in task order
+- Progress callback reports every completed run
+- Small suites skip the process pool
+"""
+
+import sys
+from unittest.mock import patch
+from pathlib import Path as _Path
+_REPO_ROOT = _Path(__file__).resolve().parents[1]
+if str(_REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(_REPO_ROOT))
+
+from spar_engine.content import load_pack
+from spar_engine.models import Constraints, SceneContext, SelectionContext
+
+from streamlit_harness import batch_runner
+from streamlit_harness.batch_runner import run_batches
+
+
+def _make_tasks():
+    tasks = []
+    for idx, phase in enumerate(["approach", "engage", "aftermath"], start=1):
+        tasks.append({
+            "scene": SceneContext(
+                scene_id=f"test:{phase}",
+                scene_phase=phase,
+                environment=["dungeon"],
+                tone=["debug"],
+                constraints=Constraints(confinement=0.8, connectivity=0.3, visibility=0.6),
+                party_band="unknown",
+                spotlight=["debug"],
+            ),
+            "selection": SelectionContext(
+                enabled_packs=["core_complications_v0_1"],
+                include_tags=[],
+                exclude_tags=[],
+                factions_present=[],
+                rarity_mode="normal",
+            ),
+            "seed": 100 + idx,
+            "n": 10,
+            "tick_between": True,
+            "ticks_between": 1,
+            "verbose": True,
+        })
+    return tasks
+
+
+class TestRunBatches:
+    """Test suite for run_batches."""
+
+    def setup_method(self):
+        self.entries = load_pack("data/core_complications.json")
+        self.tasks = _make_tasks()
+
+    def test_parallel_matches_sequential(self):
+        """Verify the process pool produces the same runs, in task order."""
+        sequential = run_batches(self.tasks, self.entries, max_workers=1)
+        parallel = run_batches(self.tasks, self.entries, max_workers=2, min_parallel_tasks=1)
+        assert parallel == sequential
+        assert [r["seed"] for r in parallel] == [101, 102, 103]
+
+    def test_progress_reports_each_run(self):
+        """Verify on_progress is called once per completed run."""
+        calls = []
+        run_batches(self.tasks, self.entries, max_workers=1, on_progress=lambda d, t: calls.append((d, t)))
+        assert calls == [(1, 3), (2, 3), (3, 3)]
+
+    def test_small_suite_runs_serially(self):
+        """Verify suites below the threshold don't start a process pool."""
+        with patch.object(batch_runner, "ProcessPoolExecutor") as mock_pool:
+            results = run_batches(self.tasks, self.entries, max_workers=2, min_parallel_tasks=len(self.tasks) + 1)
+            mock_pool.assert_not_called()
+        assert [r["seed"] for r in results] == [101, 102, 103]
@@ -0,0 +1,213 @@
+"""
+Tests for campaign persistence in the Streamlit harness.
+
+Tests cover:
+- Save/load round trip
+- Append-only ledger sidecar
+- Migration of campaigns with an inline ledger
+- Loading a campaign removed mid-lookup
+- Skipping unchanged saves
+- Selector summaries
+- Reclassifying parsed-history entities
+"""
+
+import json
+import os
+import pytest
+
+import sys
+from pathlib import Path as _Path
+_REPO_ROOT = _Path(__file__).resolve().parents[1]
+if str(_REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(_REPO_ROOT))
+
+import streamlit_harness.campaign_ui as campaign_ui
+from spar_campaign import CampaignState, FactionState, Scar
+from streamlit_harness.campaign_ui import (
+    Campaign,
+    CampaignSummary,
+    _reclassify_entity,
+    _sort_parsed_entities,
+)
+
+
+@pytest.fixture
+def campaigns_dir(tmp_path, monkeypatch):
+    """Point campaign storage at a temporary directory."""
+    monkeypatch.setattr(campaign_ui, "CAMPAIGNS_DIR", tmp_path)
+    monkeypatch.setattr(campaign_ui, "_CAMPAIGN_PATHS", {})
+    return tmp_path
+
+
+def _make_campaign() -> Campaign:
+    return Campaign(
+        campaign_id="campaign_20250101_000000",
+        name="Storage Test",
+        created="2025-01-01T00:00:00",
+        last_played="2025-01-01T00:00:00",
+        canon_summary=["It begins"],
+    )
+
+
+class TestLedgerSidecar:
+    """Test suite for the append-only ledger file."""
+
+    def test_round_trip(self, campaigns_dir):
+        """Verify a saved campaign loads back with its ledger."""
+        campaign = _make_campaign()
+        campaign.ledger.append({"session_number": 1, "what_happened": ["a"]})
+        campaign.save()
+
+        loaded = Campaign.load(campaign.campaign_id)
+        assert loaded == campaign
+        assert "ledger" not in json.loads(campaign.get_path().read_text())
+
+    def test_save_appends_only_new_entries(self, campaigns_dir):
+        """Verify repeated saves append new sessions without rewriting old ones."""
+        campaign = _make_campaign()
+        campaign.ledger.append({"session_number": 1})
+        campaign.save()
+        campaign.save()
+
+        loaded = Campaign.load(campaign.campaign_id)
+        loaded.ledger.append({"session_number": 2})
+        loaded.save()
+
+        lines = campaign.get_ledger_path().read_text().splitlines()
+        assert [json.loads(line)["session_number"] for line in lines] == [1, 2]
+        assert Campaign.load(campaign.campaign_id).ledger == loaded.ledger
+
+    def test_inline_ledger_migrates_on_save(self, campaigns_dir):
+        """Verify campaigns saved with an inline ledger still load and then migrate."""
+        campaign = _make_campaign()
+        campaign.ledger.append({"session_number": 1})
+        path = campaign.get_path()
+        path.parent.mkdir(parents=True)
+        path.write_text(json.dumps(campaign.to_dict(), indent=2))
+
+        loaded = Campaign.load(campaign.campaign_id)
+        assert loaded.ledger == [{"session_number": 1}]
+
+        loaded.save()
+        assert campaign.get_ledger_path().exists()
+        assert Campaign.load(campaign.campaign_id).ledger == [{"session_number": 1}]
+
+    def test_short_writes_are_completed(self, campaigns_dir, monkeypatch):
+        """Verify a write() that accepts only part of the payload doesn't truncate ledger lines."""
+        real_write = os.write
+        monkeypatch.setattr(campaign_ui.os, "write", lambda fd, data: real_write(fd, bytes(data[:5])))
+
+        campaign = _make_campaign()
+        campaign.ledger.extend([{"session_number": 1, "what_happened": ["a"]}, {"session_number": 2}])
+        campaign.save()
+
+        assert Campaign.load(campaign.campaign_id).ledger == campaign.ledger
+
+
+class TestLoadCampaign:
+    """Test suite for the cached load_campaign() entry point."""
+
+    def test_file_removed_after_lookup_returns_none(self, campaigns_dir, monkeypatch):
+        """Verify a campaign deleted between index lookup and stat loads as None."""
+        campaign = _make_campaign()
+        campaign.save()
+        path = campaign.get_path()
+        monkeypatch.setattr(
+            campaign_ui, "_find_campaign_path", lambda cid: (path.unlink(), path)[1]
+        )
+
+        assert campaign_ui.load_campaign(campaign.campaign_id) is None
+        assert campaign.campaign_id not in campaign_ui._CAMPAIGN_PATHS
+
+class TestSaveSkipsUnchanged:
+    """Test suite for the no-op save gate."""
+
+    def test_unchanged_campaign_is_not_rewritten(self, campaigns_dir, monkeypatch):
+        """Verify saving an unmodified campaign does not write the file again."""
+        campaign = _make_campaign()
+        campaign.save()
+        writes = []
+        real_write = campaign_ui._write_bytes_atomic
+        monkeypatch.setattr(
+            campaign_ui, "_write_bytes_atomic", lambda p, b: (writes.append(p), real_write(p, b))
+        )
+
+        loaded = Campaign.load(campaign.campaign_id)
+        loaded.save()
+        assert writes == []
+
+        loaded.canon_summary.append("Something changed")
+        loaded.save()
+        assert len(writes) == 1
+        assert Campaign.load(campaign.campaign_id).canon_summary[-1] == "Something changed"
+
+    def test_external_edit_forces_write(self, campaigns_dir):
+        """Verify a file changed on disk since load is overwritten by save."""
+        campaign = _make_campaign()
+        campaign.save()
+        loaded = Campaign.load(campaign.campaign_id)
+
+        path = campaign.get_path()
+        path.write_text(path.read_text().replace("It begins", "Edited elsewhere"))
+        os.utime(path, ns=(0, 0))
+        loaded.save()
+        assert Campaign.load(campaign.campaign_id).canon_summary == ["It begins"]
+
+
+class TestCampaignSummary:
+    """Test suite for the selector's lightweight campaign summaries."""
+
+    def test_summary_matches_full_campaign(self, campaigns_dir):
+        """Verify summary fields agree with the fully loaded CampaignState."""
+        campaign = _make_campaign()
+        campaign.campaign_state = CampaignState(
+            campaign_pressure=12,
+            heat=5,
+            scars=[Scar("s1", "physical", "low")],
+            factions={"a": FactionState("a", attention=3), "b": FactionState("b")},
+            total_scenes_run=4,
+        )
+        campaign.save()
+
+        [summary] = Campaign.list_all()
+        cs = Campaign.load(campaign.campaign_id).campaign_state
+        assert summary.pressure_band == cs.get_pressure_band() == "volatile"
+        assert summary.heat_band == cs.get_heat_band() == "noticed"
+        assert (summary.total_scenes_run, summary.scars_count) == (4, 1)
+        assert (summary.active_factions, summary.total_factions) == (1, 2)
+
+    def test_summary_without_state(self):
+        """Verify campaigns without state summarize as stateless."""
+        summary = CampaignSummary.from_dict(_make_campaign().to_dict())
+        assert not summary.has_state
+
+    def test_list_all_limit_keeps_most_recent(self, campaigns_dir):
+        """Verify a limited listing returns the most recently played campaigns in order."""
+        for day in (3, 1, 4, 2):
+            campaign = _make_campaign()
+            campaign.campaign_id = f"campaign_2025010{day}_000000"
+            campaign.last_played = f"2025-01-0{day}T00:00:00"
+            campaign.save()
+
+        assert [c.last_played[:10] for c in Campaign.list_all(limit=2)] == ["2025-01-04", "2025-01-03"]
+        assert len(Campaign.list_all()) == 4
+
+
+class TestReclassifyEntity:
+    """Test suite for moving parsed-history names between categories."""
+
+    def test_unsorted_parser_output_stays_sorted(self):
+        """Verify lists in parser (document) order are sorted once and stay sorted across moves."""
+        parsed = _sort_parsed_entities({
+            "factions": ["Moon Cult", "Harpers", "Iron Circle"],
+            "entities": {"places": ["Waterdeep", "Baldur's Gate"], "artifacts": [], "concepts": ["Fog", "Ash"]},
+        })
+        assert parsed["factions"] == ["Harpers", "Iron Circle", "Moon Cult"]
+
+        _reclassify_entity(parsed, "Harpers", "factions", "places")
+        assert parsed["entities"]["places"] == ["Baldur's Gate", "Harpers", "Waterdeep"]
+        _reclassify_entity(parsed, "Harpers", "places", "factions")
+        assert parsed["factions"] == ["Harpers", "Iron Circle", "Moon Cult"]
+
+        _reclassify_entity(parsed, "Fog", "concepts")
+        assert parsed["entities"]["concepts"] == ["Ash"]
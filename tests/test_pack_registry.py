@@ -0,0 +1,139 @@
+"""
+Tests for content pack loading in the Streamlit harness.
+
+Tests cover:
+- Startup pack registry warm-up
+- Registry lookups in load_entries
+- Re-parsing registered packs edited on disk
+- Fallback to disk for packs outside data/
+- mtime-keyed caching for every pack path
+"""
+
+import json
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+# Import functions from app.py
+import sys
+from pathlib import Path as _Path
+_REPO_ROOT = _Path(__file__).resolve().parents[1]
+if str(_REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(_REPO_ROOT))
+
+import pytest
+
+from spar_engine.content import load_pack
+from streamlit_harness.app import (
+    DEFAULT_PACK,
+    PACK_REGISTRY,
+    _cached_load_entries,
+    load_entries,
+    load_entries_cached,
+    warm_pack_registry,
+)
+
+
+class TestPackRegistry:
+    """Test suite for the in-memory content pack registry."""
+
+    def setup_method(self):
+        PACK_REGISTRY.clear()
+        self.temp_dir = tempfile.mkdtemp()
+
+    def teardown_method(self):
+        PACK_REGISTRY.clear()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_warm_registry_includes_default_pack(self):
+        """Verify the startup scan registers the built-in pack."""
+        warm_pack_registry()
+        assert DEFAULT_PACK in PACK_REGISTRY
+        assert len(PACK_REGISTRY[DEFAULT_PACK][1]) > 0
+
+    def test_load_entries_resolves_from_registry(self):
+        """Verify registered packs are returned without re-parsing."""
+        warm_pack_registry()
+        with patch("streamlit_harness.app.load_pack") as mock_load:
+            entries = load_entries(DEFAULT_PACK)
+            mock_load.assert_not_called()
+        assert entries is PACK_REGISTRY[DEFAULT_PACK][1]
+
+    def test_load_entries_normalizes_path(self):
+        """Verify equivalent relative paths share one registry entry."""
+        warm_pack_registry()
+        assert load_entries("./" + DEFAULT_PACK) is PACK_REGISTRY[DEFAULT_PACK][1]
+
+    def test_load_entries_reparses_edited_registered_pack(self):
+        """Verify a registered pack is re-read once its file mtime changes."""
+        pack_path = Path(self.temp_dir) / "registered_pack.json"
+        data = json.loads(Path(DEFAULT_PACK).read_text())
+        pack_path.write_text(json.dumps(data))
+        PACK_REGISTRY[str(pack_path)] = (pack_path.stat().st_mtime_ns, tuple(load_pack(pack_path)))
+        assert len(load_entries(str(pack_path))) == len(data)
+
+        pack_path.write_text(json.dumps(data[:3]))
+        stat = pack_path.stat()
+        os.utime(pack_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        assert len(load_entries(str(pack_path))) == 3
+        assert PACK_REGISTRY[str(pack_path)][0] == pack_path.stat().st_mtime_ns
+
+    def test_load_entries_falls_back_to_disk(self):
+        """Verify packs outside the registry still load from disk."""
+        src = Path(DEFAULT_PACK)
+        dst = Path(self.temp_dir) / "custom_pack.json"
+        dst.write_text(src.read_text())
+        entries = load_entries(str(dst))
+        assert len(entries) == len(json.loads(src.read_text()))
+
+    def test_load_entries_missing_pack_raises(self):
+        """Verify unknown paths still raise FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            load_entries(str(Path(self.temp_dir) / "missing.json"))
+
+
+class TestCachedPackLoading:
+    """Test suite for mtime-keyed pack caching."""
+
+    def setup_method(self):
+        PACK_REGISTRY.clear()
+        _cached_load_entries.clear()
+        self.temp_dir = tempfile.mkdtemp()
+        self.pack_path = Path(self.temp_dir) / "custom_pack.json"
+        self.pack_path.write_text(Path(DEFAULT_PACK).read_text())
+
+    def teardown_method(self):
+        PACK_REGISTRY.clear()
+        _cached_load_entries.clear()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_unchanged_pack_is_parsed_once(self):
+        """Verify repeated loads of an unchanged file hit the cache."""
+        with patch("streamlit_harness.app.load_pack", wraps=load_pack) as mock_load:
+            load_entries_cached(str(self.pack_path))
+            load_entries_cached(str(self.pack_path))
+            assert mock_load.call_count == 1
+
+    def test_modified_pack_is_reparsed(self):
+        """Verify a new mtime invalidates the cached entries."""
+        data = json.loads(self.pack_path.read_text())
+        first = load_entries_cached(str(self.pack_path))
+        self.pack_path.write_text(json.dumps(data[:3]))
+        stat = self.pack_path.stat()
+        os.utime(self.pack_path, (stat.st_atime, stat.st_mtime + 10))
+        second = load_entries_cached(str(self.pack_path))
+        assert len(first) == len(data)
+        assert len(second) == 3
+
+    def test_registered_pack_is_keyed_on_mtime(self):
+        """Verify packs in PACK_REGISTRY also go through the mtime-keyed cache."""
+        data = json.loads(self.pack_path.read_text())
+        PACK_REGISTRY[str(self.pack_path)] = (self.pack_path.stat().st_mtime_ns, tuple(load_pack(self.pack_path)))
+        assert len(load_entries_cached(str(self.pack_path))) == len(data)
+
+        self.pack_path.write_text(json.dumps(data[:3]))
+        stat = self.pack_path.stat()
+        os.utime(self.pack_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        assert len(load_entries_cached(str(self.pack_path))) == 3
@@ -6,6 +6,7 @@ Tests cover:
 - Random seed generation
 - Configuration persistence
 - Scenario JSON loading/validation
+- Built-in scenario library caching
 - Scenario execution
 """
 
@@ -32,6 +33,9 @@ from streamlit_harness.app import (
     save_config,
     load_scenario_json,
     save_report_to_path,
+    builtin_scenario_library,
+    _cached_scenario_library,
+    suite_summary_frame,
 )
 
 
@@ -290,6 +294,20 @@ class TestScenarioLoading:
         assert scenario["name"] == "Test Scenario"
         assert scenario["batch_size"] == 10
     
+    def test_load_scenario_from_bytes(self):
+        """Verify raw uploaded bytes load without decoding first."""
+        raw = json.dumps({
+            "name": "Bytes Scenario",
+            "presets": ["dungeon"],
+            "phases": ["engage"],
+            "rarity_modes": ["normal"],
+            "batch_size": 5,
+            "base_seed": 1
+        }).encode("utf-8")
+        
+        scenario = load_scenario_json(raw)
+        assert scenario["name"] == "Bytes Scenario"
+    
     def test_load_scenario_with_invalid_json(self):
         """Verify invalid JSON raises ValueError."""
         with pytest.raises(ValueError, match="Invalid JSON"):
@@ -372,6 +390,17 @@ class TestReportSaving:
         assert loaded["suite"] == "Test Suite"
         assert loaded["batch_n"] == 10
     
+    def test_save_report_non_string_keys(self):
+        """Verify int-keyed dicts (e.g. severity buckets) serialize as string keys."""
+        report = {"summary": {"severity_buckets": {1: 3, 2: 5}}}
+        path = f"{self.temp_dir}/report.json"
+        
+        success, _ = save_report_to_path(report, path)
+        
+        assert success
+        loaded = json.loads(Path(path).read_text())
+        assert loaded["summary"]["severity_buckets"] == {"1": 3, "2": 5}
+    
     def test_save_report_overwrites_existing(self):
         """Verify existing files are overwritten."""
         path = f"{self.temp_dir}/report.json"
@@ -386,6 +415,17 @@ class TestReportSaving:
         assert "old content" not in content
         assert "new" in content
     
+    def test_save_report_failure_keeps_existing_file(self):
+        """Verify a report that fails to serialize doesn't truncate the previous file."""
+        path = f"{self.temp_dir}/report.json"
+        Path(path).write_text('{"old": "report"}')
+        
+        success, _ = save_report_to_path({"bad": object()}, path)
+        
+        assert not success
+        assert json.loads(Path(path).read_text()) == {"old": "report"}
+        assert not Path(f"{path}.tmp").exists()
+    
     def test_save_report_handles_errors(self):
         """Verify error handling for invalid paths."""
         report = {"test": "data"}
@@ -398,6 +438,37 @@ class TestReportSaving:
         assert "failed" in message.lower()
 
 
+class TestScenarioLibrary:
+    """Test suite for the cached built-in scenario library."""
+    
+    def setup_method(self):
+        self.temp_dir = Path(tempfile.mkdtemp())
+        _cached_scenario_library.clear()
+    
+    def teardown_method(self):
+        _cached_scenario_library.clear()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    def test_library_skips_unnamed_scenarios(self):
+        """Verify only named scenarios reach the dropdown."""
+        (self.temp_dir / "a.json").write_text(json.dumps({"name": "Alpha"}))
+        (self.temp_dir / "b.json").write_text(json.dumps({"presets": ["dungeon"]}))
+        with patch("streamlit_harness.app.SCENARIOS_DIR", self.temp_dir):
+            names, by_name = builtin_scenario_library()
+        assert names == ["Alpha"]
+        assert by_name["Alpha"]["name"] == "Alpha"
+    
+    def test_library_picks_up_new_files(self):
+        """Verify a newly saved scenario invalidates the cached library."""
+        (self.temp_dir / "a.json").write_text(json.dumps({"name": "Alpha"}))
+        with patch("streamlit_harness.app.SCENARIOS_DIR", self.temp_dir):
+            first, _ = builtin_scenario_library()
+            (self.temp_dir / "b.json").write_text(json.dumps({"name": "Beta"}))
+            second, _ = builtin_scenario_library()
+        assert first == ["Alpha"]
+        assert second == ["Alpha", "Beta"]
+
+
 class TestScenarioExecution:
     """Integration tests for scenario execution.
     
@@ -431,6 +502,39 @@ class TestScenarioExecution:
         assert resolved == 42
 
 
+class TestSuiteSummary:
+    """Test suite for the suite summary table."""
+    
+    def _run(self, preset, cutoff_rate, severity_avg):
+        return {
+            "preset": preset,
+            "phase": "engage",
+            "rarity_mode": "normal",
+            "seed": 1,
+            "result": {"summary": {
+                "cutoff_rate": cutoff_rate,
+                "cutoff_resolutions": {"none": 10},
+                "severity_buckets": {"1-3": 5, "4-6": 4, "7-10": 1},
+                "severity_avg": severity_avg,
+                "severity_min": 1,
+                "severity_max": 8,
+            }},
+        }
+    
+    def test_summary_frame_rounds_columns(self):
+        """Verify one row per run with rounded percentage and average."""
+        report = {"runs": [self._run("dungeon", 0.12346, 3.456), self._run("city", 0.5, None)]}
+        df = suite_summary_frame(report)
+        assert list(df["preset"]) == ["dungeon", "city"]
+        assert df["cutoff_rate_pct"].tolist() == [12.35, 50.0]
+        assert df["severity_avg"][0] == 3.46
+        assert df["severity_avg"].isna()[1]
+    
+    def test_summary_frame_empty_report(self):
+        """Verify reports without runs (e.g. campaign mode) give an empty table."""
+        assert suite_summary_frame({"scenes": []}).empty
+
+
 class TestPathPersistence:
     """Test suite for path persistence and manual edit tracking."""
     
@@ -516,6 +620,54 @@ class TestPathPersistence:
                 assert loaded["output_path_manually_edited"] is True
 
 
+    def test_update_keeps_keys_saved_by_other_sessions(self):
+        """Verify a session's path update doesn't overwrite keys written since it cached the config."""
+        with patch('streamlit_harness.app.CONFIG_FILE', self.config_path):
+            from streamlit_harness.app import session_config, update_persistent_path, load_config, save_config
+
+            # Session state allows both attribute and item access, like st.session_state
+            class MockSessionState(dict):
+                __getattr__ = dict.get
+
+            with patch('streamlit_harness.app.st') as mock_st:
+                mock_st.session_state = MockSessionState()
+                session_config()  # This session caches the (default) config
+
+                # Another session saves a key after that
+                save_config({**load_config(), "template_save_path": "scenarios/other_session.json"})
+
+                update_persistent_path("report_save_path", "results/mine.json")
+
+                loaded = load_config()
+                assert loaded["template_save_path"] == "scenarios/other_session.json"
+                assert loaded["report_save_path"] == "results/mine.json"
+                assert session_config() == loaded
+
+class TestSuitePathDefaults:
+    """Test suite for the suite template/report default save paths."""
+
+    def test_template_path_input_follows_suite_switch(self, tmp_path, monkeypatch):
+        """Verify switching suites updates the keyed template path input, not just session state."""
+        from streamlit.testing.v1 import AppTest
+
+        # Run in a scratch directory so the saved template and config stay out of the repo
+        (tmp_path / "data").symlink_to(_REPO_ROOT / "data", target_is_directory=True)
+        (tmp_path / "campaigns").mkdir()
+        monkeypatch.chdir(tmp_path)
+
+        at = AppTest.from_file(str(_REPO_ROOT / "streamlit_harness" / "app.py"), default_timeout=60).run()
+        at.radio[0].set_value("⚡ Event Generator").run()
+        assert "normal_quick" in at.text_input(key="template_path_input").value
+
+        next(s for s in at.selectbox if s.label == "Suite").set_value("Presets × Engage × (Calm/Normal/Spiky)")
+        next(b for b in at.button if b.label == "Save as Template").click().run()
+
+        assert not at.exception
+        widget_path = at.text_input(key="template_path_input").value
+        assert widget_path == at.session_state.template_save_path
+        assert "calm" in widget_path and "normal_quick" not in widget_path
+
+
 class TestScenarioValidation:
     """Test suite for scenario validation edge cases."""
     
@@ -1,5 +1,5 @@
 from spar_engine.models import EngineState, StateDelta
-from spar_engine.state import apply_state_delta, tick_state
+from spar_engine.state import apply_state_delta, apply_state_delta_and_tick, tick_state
 
 def test_apply_state_delta_updates_clocks_and_recent_ids():
     s = EngineState.default()
@@ -24,3 +24,15 @@ def test_apply_state_delta_clamps_clocks():
     d = StateDelta(clocks={"tension": 999}, recent_event_ids_add=[], tag_cooldowns_set={}, flags_set={})
     s2 = apply_state_delta(s, d, clock_min=0, clock_max=12)
     assert s2.clocks["tension"] == 12
+
+
+def test_apply_state_delta_and_tick_matches_sequential_calls():
+    s = EngineState(
+        clocks={"tension": 1},
+        recent_event_ids=["x", "y", "z"],
+        tag_cooldowns={"hazard": 1, "terrain": 4},
+        flags={"alarm_raised": False},
+    )
+    d = StateDelta(clocks={"tension": 2}, recent_event_ids_add=["a"], tag_cooldowns_set={"mystic": 3}, flags_set={"alarm_raised": True})
+    for ticks in (0, 1, 3):
+        assert apply_state_delta_and_tick(s, d, ticks=ticks) == tick_state(apply_state_delta(s, d), ticks=ticks)